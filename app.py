@@ -1,7 +1,15 @@
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Any, Iterable, List, Optional, Set, Tuple
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -14,6 +22,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -39,6 +48,40 @@ async def root() -> Dict[str, str]:
 async def health() -> Dict[str, str]:
     return {"status": "healthy"}
 
+# Characters that make a search string a regular expression rather than plain text
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+@lru_cache(maxsize=256)
+def _compile_search(pattern: str) -> "re.Pattern[str]":
+    """Compile a search pattern once and reuse it across requests."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+def _search_matcher(search: str) -> Callable[[int], bool]:
+    """Build a predicate matching products (by position) on name or description."""
+    if not _REGEX_META.search(search):
+        # Plain text: substring match on the pre-casefolded columns
+        needle = search.casefold()
+        return lambda idx: needle in _names_lc[idx] or needle in _descs_lc[idx]
+    
+    # Chained wildcards backtrack badly on non-matching input
+    if search.count(".*") > 1:
+        raise HTTPException(status_code=400, detail="Search pattern may contain at most one '.*'")
+    try:
+        pattern = _compile_search(search)
+    except re.error:
+        raise HTTPException(status_code=400, detail="Invalid search pattern")
+    
+    def matches(idx: int) -> bool:
+        product = PRODUCTS[idx]
+        return bool(
+            pattern.search(str(product.get("name") or ""))
+            or pattern.search(str(product.get("description") or ""))
+        )
+    
+    return matches
+
 # Mock product data
 PRODUCTS = [
     {
@@ -63,21 +106,80 @@ PRODUCTS = [
 # Mock orders data
 ORDERS = []
 
+# Secondary indexes over PRODUCTS (values are positions in PRODUCTS)
+_by_id: Dict[str, Dict[str, Any]] = {}
+_by_category: Dict[str, Set[int]] = defaultdict(set)
+_by_brand: Dict[str, Set[int]] = defaultdict(set)
+_by_size: Dict[str, Set[int]] = defaultdict(set)
+_price_sorted: List[Tuple[float, int]] = []
+
+# Casefolded search columns, parallel to PRODUCTS, so responses stay untouched
+_names_lc: List[str] = []
+_descs_lc: List[str] = []
+
+
+def _index_product(product: Dict[str, Any], idx: int) -> None:
+    """Register a product stored at PRODUCTS[idx] in the lookup indexes."""
+    # Build every entry before touching a store, so a bad field can't leave them half-updated
+    category = product.get("category")
+    brand = product.get("brand")
+    sizes = [s["size"] for s in product.get("sizes") or () if s.get("size")]
+    price_entry = (product.get("price", 0), idx)
+    # `or ""` also covers keys present with a null value
+    name_lc = str(product.get("name") or "").casefold()
+    desc_lc = str(product.get("description") or "").casefold()
+    
+    _by_id[product.get("id")] = product
+    if category:
+        _by_category[category].add(idx)
+    if brand:
+        _by_brand[brand].add(idx)
+    for size in sizes:
+        _by_size[size].add(idx)
+    insort(_price_sorted, price_entry)
+    _names_lc.append(name_lc)
+    _descs_lc.append(desc_lc)
+
+
+for _idx, _product in enumerate(PRODUCTS):
+    _index_product(_product, _idx)
+
+
+# Short-lived cache of list_products responses, keyed on the query parameters
+_list_cache: TTLCache = TTLCache(maxsize=512, ttl=5)
+
+
+def _paginate(matches: Iterable[Dict[str, Any]], skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """Count all matches but only keep the requested page."""
+    page: List[Dict[str, Any]] = []
+    total = 0
+    for item in matches:
+        if skip <= total < skip + limit:
+            page.append(item)
+        total += 1
+    return page, total
+
 # Product endpoints
 @app.post("/api/v1/products", status_code=201)
 async def create_product(product: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new product."""
     # Add timestamp
-    from datetime import datetime
-    product["created_at"] = datetime.utcnow().isoformat()
-    product["updated_at"] = datetime.utcnow().isoformat()
+    now = datetime.utcnow().isoformat()
+    product["created_at"] = product["updated_at"] = now
+    
+    # Price is the sort key of _price_sorted, so it must be a number (missing or null means 0)
+    try:
+        product["price"] = float(product.get("price") or 0)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="price must be a number")
     
     # Add ID
-    import uuid
-    product["id"] = str(uuid.uuid4())
+    product["id"] = uuid.uuid4().hex
     
-    # Add to mock database
+    # Add to mock database; indexed first so a failure leaves PRODUCTS untouched
+    _index_product(product, len(PRODUCTS))
     PRODUCTS.append(product)
+    _list_cache.clear()
     
     return product
 
@@ -93,45 +195,73 @@ async def list_products(
     skip: int = 0
 ) -> Dict[str, Any]:
     """Get a list of products with optional filtering."""
-    # Filter products
-    filtered_products = PRODUCTS
+    cache_key = (category, brand, min_price, max_price, size, search, limit, skip)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("list_products cache hit")
+        return cached
+    logger.debug("list_products cache miss")
     
+    # Start from the most selective index and check the remaining filters in one pass
+    index_sets: List[Set[int]] = []
     if category:
-        filtered_products = [p for p in filtered_products if p.get("category") == category]
+        index_sets.append(_by_category.get(category, set()))
     if brand:
-        filtered_products = [p for p in filtered_products if p.get("brand") == brand]
-    if min_price is not None:
-        filtered_products = [p for p in filtered_products if p.get("price", 0) >= min_price]
-    if max_price is not None:
-        filtered_products = [p for p in filtered_products if p.get("price", 0) <= max_price]
+        index_sets.append(_by_brand.get(brand, set()))
     if size:
-        filtered_products = [p for p in filtered_products if any(s.get("size") == size for s in p.get("sizes", []))]
-    if search:
-        import re
-        pattern = re.compile(search, re.IGNORECASE)
-        filtered_products = [
-            p for p in filtered_products 
-            if pattern.search(p.get("name", "")) or pattern.search(p.get("description", ""))
-        ]
-    
-    # Apply pagination
-    paginated_products = filtered_products[skip:skip + limit]
+        index_sets.append(_by_size.get(size, set()))
+    check_price = min_price is not None or max_price is not None
+    
+    if index_sets:
+        index_sets.sort(key=len)
+        positions = sorted(index_sets.pop(0))
+    elif check_price:
+        lo = bisect_left(_price_sorted, (min_price, -1)) if min_price is not None else 0
+        hi = bisect_right(_price_sorted, (max_price, len(PRODUCTS))) if max_price is not None else len(_price_sorted)
+        positions = sorted(idx for _, idx in _price_sorted[lo:hi])
+        check_price = False
+    else:
+        positions = range(len(PRODUCTS))
+    
+    matches_search = _search_matcher(search) if search else None
+    
+    if index_sets or check_price or matches_search:
+        def keep(idx: int) -> bool:
+            for index in index_sets:
+                if idx not in index:
+                    return False
+            product = PRODUCTS[idx]
+            if check_price:
+                price = product.get("price", 0)
+                if min_price is not None and price < min_price:
+                    return False
+                if max_price is not None and price > max_price:
+                    return False
+            # Text search is the most expensive check, so it runs last
+            return matches_search is None or matches_search(idx)
+        
+        matches = (PRODUCTS[i] for i in positions if keep(i))
+        paginated_products, total = _paginate(matches, skip, limit)
+    else:
+        paginated_products = [PRODUCTS[i] for i in positions[skip:skip + limit]]
+        total = len(positions)
     
     # Return paginated response
-    return {
+    result = {
         "items": paginated_products,
-        "total": len(filtered_products),
+        "total": total,
         "limit": limit,
         "skip": skip
     }
+    _list_cache[cache_key] = result
+    return result
 
 @app.get("/api/v1/products/{product_id}")
 async def get_product(product_id: str) -> Dict[str, Any]:
     """Get a product by ID."""
-    # Find product by ID
-    for product in PRODUCTS:
-        if product.get("id") == product_id:
-            return product
+    product = _by_id.get(product_id)
+    if product is not None:
+        return product
     
     # Return 404 if not found
     raise HTTPException(status_code=404, detail="Product not found")
@@ -141,37 +271,26 @@ async def get_product(product_id: str) -> Dict[str, Any]:
 async def create_order(order: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new order."""
     # Add timestamp
-    from datetime import datetime
-    order["created_at"] = datetime.utcnow().isoformat()
-    order["updated_at"] = datetime.utcnow().isoformat()
+    now = datetime.utcnow().isoformat()
+    order["created_at"] = order["updated_at"] = now
     
     # Add ID
-    import uuid
-    order["id"] = str(uuid.uuid4())
-    
-    # Calculate subtotal, tax, and total
-    subtotal = 0
-    for item in order.get("items", []):
-        product_id = item.get("product_id")
-        quantity = item.get("quantity", 1)
-        
-        # Find product
-        product = None
-        for p in PRODUCTS:
-            if p.get("id") == product_id:
-                product = p
-                break
-        
-        if not product:
-            raise HTTPException(status_code=404, detail=f"Product not found: {product_id}")
-        
-        # Add product details to item
+    order["id"] = uuid.uuid4().hex
+    
+    # Resolve all products up front so a missing one fails before any item is touched
+    items = order.get("items", [])
+    missing = [item.get("product_id") for item in items if item.get("product_id") not in _by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Product not found: {missing[0]}")
+    
+    # Add product details to items
+    for item in items:
+        product = _by_id[item.get("product_id")]
         item["product_name"] = product.get("name", "Unknown Product")
         item["price"] = product.get("price", 0)
-        item["subtotal"] = item["price"] * quantity
-        
-        # Add to subtotal
-        subtotal += item["subtotal"]
+        item["subtotal"] = item["price"] * item.get("quantity", 1)
+    
+    subtotal = sum(item["subtotal"] for item in items)
     
     # Set order totals
     order["subtotal"] = subtotal
@@ -195,19 +314,17 @@ async def list_orders(
     skip: int = 0
 ) -> Dict[str, Any]:
     """Get a list of orders with optional filtering."""
-    # Filter orders
-    filtered_orders = ORDERS
-    
+    # Filter and paginate in a single pass
     if user_id:
-        filtered_orders = [o for o in filtered_orders if o.get("user_id") == user_id]
-    
-    # Apply pagination
-    paginated_orders = filtered_orders[skip:skip + limit]
+        matches = (o for o in ORDERS if o.get("user_id") == user_id)
+        paginated_orders, total = _paginate(matches, skip, limit)
+    else:
+        paginated_orders, total = ORDERS[skip:skip + limit], len(ORDERS)
     
     # Return paginated response
     return {
         "items": paginated_orders,
-        "total": len(filtered_orders),
+        "total": total,
         "limit": limit,
         "skip": skip
     }
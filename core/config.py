@@ -8,6 +8,11 @@ class Settings(BaseSettings):
     # MongoDB
     MONGODB_URL: str = Field(..., description="MongoDB connection string")
     MONGODB_DB_NAME: str = Field(default="ecommerce", description="MongoDB database name")
+    MONGODB_MAX_POOL_SIZE: int = Field(default=200, description="Maximum connections per MongoDB client")
+    MONGODB_MIN_POOL_SIZE: int = Field(default=10, description="Connections kept open while idle")
+    MONGODB_MAX_IDLE_MS: int = Field(default=60000, description="Close pooled connections idle for longer than this")
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = Field(default=5000, description="Fail fast when no server is reachable")
+    MONGODB_COMPRESSORS: str = Field(default="zstd,zlib", description="Wire compressors in order of preference")
 
     # API metadata
     API_PREFIX: str = "/api/v1"
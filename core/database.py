@@ -1,6 +1,7 @@
 # Create core/database.py
 import motor.motor_asyncio
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 from core.config import settings
 import logging
 from typing import Optional
@@ -17,7 +18,14 @@ async def connect_to_mongo() -> None:
     """Connect to MongoDB on application startup."""
     global client, db
     try:
-        client = AsyncIOMotorClient(settings.MONGODB_URL)
+        client = AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            compressors=settings.MONGODB_COMPRESSORS,
+        )
         db = client[settings.MONGODB_DB_NAME]
         
         # Verify connection is working
@@ -28,6 +36,34 @@ async def connect_to_mongo() -> None:
         raise
 
 
+async def ensure_product_indexes() -> None:
+    """Create the indexes backing the product list queries."""
+    await get_collection("products").create_indexes([
+        IndexModel([("category", ASCENDING)]),
+        IndexModel([("brand", ASCENDING)]),
+        IndexModel([("price", ASCENDING)]),
+        IndexModel([("sizes.size", ASCENDING)]),
+        IndexModel([("name", TEXT), ("description", TEXT), ("tags", TEXT)], name="product_text"),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ])
+    logger.info("Product indexes ensured")
+
+
+async def ensure_order_indexes() -> None:
+    """Create the indexes backing the order list queries."""
+    await get_collection("orders").create_indexes([
+        IndexModel([("user_id", ASCENDING), ("_id", ASCENDING)]),
+        IndexModel([("created_at", DESCENDING), ("_id", DESCENDING)]),
+    ])
+    logger.info("Order indexes ensured")
+
+
+async def ensure_user_indexes() -> None:
+    """Create the unique email index used by user lookups."""
+    await get_collection("users").create_index("email", unique=True, name="email_1")
+    logger.info("User indexes ensured")
+
+
 async def close_mongo_connection() -> None:
     """Close MongoDB connection on application shutdown."""
     global client
@@ -4,6 +4,11 @@ from typing import Dict, Any
 import json
 from core.config import settings
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
@@ -24,7 +29,9 @@ class JSONFormatter(logging.Formatter):
         # Add extra fields from record
         if hasattr(record, "extra"):
             log_data.update(record.extra)
-            
+        
+        if orjson is not None:
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
         return json.dumps(log_data)
 
 
@@ -32,10 +32,7 @@ def main():
         shutil.copy("schemas/common_v2.py", "schemas/common.py")
         print("✅ Replaced schemas/common.py with v2 version")
     
-    # Replace schemas/order.py with schemas/order_v2.py
-    if os.path.exists("schemas/order_v2.py"):
-        shutil.copy("schemas/order_v2.py", "schemas/order.py")
-        print("✅ Replaced schemas/order.py with v2 version")
+    # schemas/order.py re-exports schemas/order_v2.py, so it needs no replacement
     
     print("Deployment preparation complete!")
     return 0
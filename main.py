@@ -1,13 +1,22 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
 from core.config import settings
-from core.database import connect_to_mongo, close_mongo_connection
+from core.database import (
+    connect_to_mongo,
+    close_mongo_connection,
+    ensure_product_indexes,
+    ensure_order_indexes,
+    ensure_user_indexes,
+)
 from core.logging import setup_logging
 from routes import api_router
+from utils.bson_utils import MongoJSONResponse
 from utils.errors import (
     APIError,
     api_error_handler,
@@ -20,6 +29,16 @@ from utils.errors import (
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Database connection
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("💚 Starting up application")
+    await connect_to_mongo()
+    await asyncio.gather(ensure_product_indexes(), ensure_order_indexes(), ensure_user_indexes())
+    yield
+    logger.info("💔 Shutting down application")
+    await close_mongo_connection()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -28,6 +47,8 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=MongoJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -48,17 +69,6 @@ app.add_exception_handler(Exception, general_exception_handler)
 # Mount versioned routes
 app.include_router(api_router, prefix=settings.API_PREFIX)
 
-# Database connection
-@app.on_event("startup")
-async def startup_db_client():
-    logger.info("💚 Starting up application")
-    await connect_to_mongo()
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    logger.info("💔 Shutting down application")
-    await close_mongo_connection()
-
 # Root endpoint
 @app.get("/", include_in_schema=False)
 async def root():
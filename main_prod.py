@@ -1,15 +1,37 @@
+import asyncio
 import logging
+import os
+import sys
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from core.config import settings
-from core.database import connect_to_mongo, close_mongo_connection
+from core.database import (
+    connect_to_mongo,
+    close_mongo_connection,
+    ensure_product_indexes,
+    ensure_order_indexes,
+    ensure_user_indexes,
+)
 from routes import api_router
+from utils.bson_utils import MongoJSONResponse
+from utils.errors import general_exception_handler
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Database connection
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("Starting up application")
+    await connect_to_mongo()
+    await asyncio.gather(ensure_product_indexes(), ensure_order_indexes(), ensure_user_indexes())
+    yield
+    logger.info("Shutting down application")
+    await close_mongo_connection()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -18,6 +40,8 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=MongoJSONResponse,
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -29,20 +53,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Unhandled errors become a uniform 500 instead of per-handler try/except
+app.add_exception_handler(Exception, general_exception_handler)
+
 # Mount versioned routes
 app.include_router(api_router, prefix=settings.API_PREFIX)
 
-# Database connection
-@app.on_event("startup")
-async def startup_db_client():
-    logger.info("Starting up application")
-    await connect_to_mongo()
-
-@app.on_event("shutdown")
-async def shutdown_db_client():
-    logger.info("Shutting down application")
-    await close_mongo_connection()
-
 # Root endpoint
 @app.get("/", include_in_schema=False)
 async def root():
@@ -56,4 +72,18 @@ async def root():
 # Health check
 @app.get("/health", include_in_schema=False)
 async def health():
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {"status": "healthy"} 
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop/httptools are not available on Windows; fall back to the stdlib loop there
+    on_windows = sys.platform == "win32"
+    uvicorn.run(
+        "main_prod:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8000)),
+        loop="asyncio" if on_windows else "uvloop",
+        http="h11" if on_windows else "httptools",
+        workers=os.cpu_count() or 1,
+    )
@@ -1,25 +1,32 @@
 from datetime import datetime
-from typing import Optional, Any, Dict
-from pydantic import BaseModel, Field
+from typing import Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import core_schema
 from bson import ObjectId
 
+from utils.bson_utils import to_object_id
+
 
 class PyObjectId(ObjectId):
     """Custom ObjectId type for Pydantic models to handle MongoDB's ObjectId."""
     
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(str, when_used="json"),
+        )
     
     @classmethod
     def validate(cls, v):
-        if not ObjectId.is_valid(v):
+        object_id = to_object_id(v)
+        if object_id is None:
             raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
+        return object_id
     
     @classmethod
-    def __modify_schema__(cls, field_schema):
-        field_schema.update(type="string")
+    def __get_pydantic_json_schema__(cls, schema: core_schema.CoreSchema, handler: Any) -> dict:
+        return {"type": "string"}
 
 
 class MongoBaseModel(BaseModel):
@@ -27,18 +34,11 @@ class MongoBaseModel(BaseModel):
     
     id: Optional[PyObjectId] = Field(default_factory=PyObjectId, alias="_id")
     
-    class Config:
-        allow_population_by_field_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        
-    def dict(self, **kwargs) -> Dict[str, Any]:
-        """Override dict method to convert _id to string."""
-        dict_repr = super().dict(**kwargs)
-        # Convert _id to string if it exists
-        if "_id" in dict_repr and dict_repr["_id"] is not None:
-            dict_repr["_id"] = str(dict_repr["_id"])
-        return dict_repr
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        json_encoders={ObjectId: str},
+    )
 
 
 class TimestampedModel(MongoBaseModel):
@@ -47,8 +47,9 @@ class TimestampedModel(MongoBaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: Optional[datetime] = None
     
-    class Config:
-        json_encoders = {**MongoBaseModel.Config.json_encoders, datetime: lambda v: v.isoformat()}
+    model_config = ConfigDict(
+        json_encoders={**MongoBaseModel.model_config["json_encoders"], datetime: lambda v: v.isoformat()},
+    )
 
 
 class PaginationParams(BaseModel):
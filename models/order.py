@@ -4,70 +4,58 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 from pydantic import Field, BaseModel, validator
-from bson import ObjectId
+from pymongo import ReturnDocument
 from core.database import get_collection
+from utils.bson_utils import is_object_id, parse_object_id, to_object_id
+
+def _enrich(item: Dict[str, Any], _float=float, _int=int, _round=round) -> Dict[str, Any]:
+    # Ensure each item has product_name, price, and subtotal (mutates the owned doc in place)
+    item.setdefault("product_name", item.get("name", "Unknown Product"))
+    price = item.setdefault("price", _float(item.get("unit_price", 0)))
+    if "subtotal" not in item:
+        item["subtotal"] = _round(_int(item.get("quantity", 1)) * _float(price), 2)
+    return item
 
 
 # Helper to convert ObjectId to str
 def order_helper(order_doc: Dict[str, Any]) -> Dict[str, Any]:
-    # Process order items to ensure they have required fields
-    items = order_doc.get("items", [])
-    processed_items = []
-    
-    for item in items:
-        processed_item = dict(item)
-        # Ensure each item has product_name, price, and subtotal
-        if "product_name" not in processed_item:
-            processed_item["product_name"] = processed_item.get("name", "Unknown Product")
-        
-        if "price" not in processed_item:
-            processed_item["price"] = float(processed_item.get("unit_price", 0))
-        
-        if "subtotal" not in processed_item:
-            quantity = int(processed_item.get("quantity", 1))
-            price = float(processed_item.get("price", 0))
-            processed_item["subtotal"] = round(quantity * price, 2)
-            
-        processed_items.append(processed_item)
-    
-    # Format datetime objects as strings
-    created_at = order_doc.get("created_at")
-    if created_at and isinstance(created_at, datetime):
-        created_at = created_at.isoformat()
-        
-    updated_at = order_doc.get("updated_at")
-    if updated_at and isinstance(updated_at, datetime):
-        updated_at = updated_at.isoformat()
+    # Runs once per document on every list page; bind the lookups locally
+    get = order_doc.get
+    processed_items = [_enrich(item) for item in get("items", ())]
     
     # Check for status fields
-    order_status = order_doc.get("order_status")
+    order_status = get("order_status")
     if order_status is None:
         # Try to get from status field for backward compatibility
-        order_status = order_doc.get("status", "pending")
-        
-    payment_status = order_doc.get("payment_status", "pending")
+        order_status = get("status", "pending")
     
     return {
-        "id": str(order_doc.get("_id", "")),
-        "user_id": order_doc.get("user_id"),
+        "id": str(get("_id", "")),
+        "user_id": get("user_id"),
         "items": processed_items,
-        "shipping_address": order_doc.get("shipping_address", {}),
+        "shipping_address": get("shipping_address", {}),
         "order_status": order_status,
-        "payment_status": payment_status,
-        "subtotal": order_doc.get("subtotal", 0.0),
-        "shipping_cost": order_doc.get("shipping_cost", 0.0),
-        "tax": order_doc.get("tax", 0.0),
-        "total": order_doc.get("total", order_doc.get("total_amount", 0.0)),
-        "tracking_number": order_doc.get("tracking_number"),
-        "notes": order_doc.get("notes"),
-        "created_at": created_at,
-        "updated_at": updated_at,
+        "payment_status": get("payment_status", "pending"),
+        "subtotal": get("subtotal", 0.0),
+        "shipping_cost": get("shipping_cost", 0.0),
+        "tax": get("tax", 0.0),
+        "total": get("total", get("total_amount", 0.0)),
+        "tracking_number": get("tracking_number"),
+        "notes": get("notes"),
+        # Datetimes stay BSON datetimes; the response serializer formats them
+        "created_at": get("created_at"),
+        "updated_at": get("updated_at"),
     }
 
 
 def get_order_lookup_pipeline(user_id: str, limit: int, offset: int) -> List[dict]:
+    # Paginate before the $lookup so the join only runs on the returned page.
+    # Run with aggregate(..., allowDiskUse=False) so runaway sorts fail fast.
     return [
         {"$match": {"user_id": user_id}},
+        {"$sort": {"_id": 1}},
+        {"$skip": offset},
+        {"$limit": limit},
         {
             "$lookup": {
                 "from": "products",
@@ -76,9 +64,28 @@ def get_order_lookup_pipeline(user_id: str, limit: int, offset: int) -> List[dic
                 "as": "product_details"
             }
         },
-        {"$sort": {"_id": 1}},
-        {"$skip": offset},
-        {"$limit": limit},
+        {
+            "$project": {
+                "user_id": 1,
+                "items": 1,
+                "shipping_address": 1,
+                "order_status": 1,
+                "status": 1,
+                "payment_status": 1,
+                "subtotal": 1,
+                "shipping_cost": 1,
+                "tax": 1,
+                "total": 1,
+                "total_amount": 1,
+                "tracking_number": 1,
+                "notes": 1,
+                "created_at": 1,
+                "updated_at": 1,
+                "product_details._id": 1,
+                "product_details.name": 1,
+                "product_details.price": 1,
+            }
+        },
     ]
 
 
@@ -154,13 +161,33 @@ class Order(TimestampedModel):
 
     @classmethod
     async def get_by_id(cls, db, order_id: str):
-        if not ObjectId.is_valid(order_id):
+        object_id = to_object_id(order_id)
+        if object_id is None:
             return None
-        order_data = await get_collection("orders").find_one({"_id": ObjectId(order_id)})
+        order_data = await get_collection("orders").find_one({"_id": object_id})
         return cls(**order_data) if order_data else None
 
     @classmethod
     async def create(cls, db, order_data: dict):
+        # Resolve every line item's product in one round trip
+        items = order_data["items"]
+        for item in items:
+            # A malformed id can't name a product; report it like a missing one, not a 500
+            if not is_object_id(item["product_id"]):
+                raise ValueError(f"Product not found: {item['product_id']}")
+        ids = [parse_object_id(item["product_id"]) for item in items]
+        products = {
+            p["_id"]: p
+            async for p in get_collection("products").find({"_id": {"$in": ids}}, {"name": 1, "price": 1})
+        }
+        for oid, item in zip(ids, items):
+            product = products.get(oid)
+            if product is None:
+                raise ValueError(f"Product not found: {item['product_id']}")
+            item["product_name"] = product["name"]
+            item["price"] = product["price"]
+            item["subtotal"] = round(item["price"] * item["quantity"], 2)
+
         order = cls(**order_data)
         order_dict = order.dict(by_alias=True)
         result = await get_collection("orders").insert_one(order_dict)
@@ -169,16 +196,15 @@ class Order(TimestampedModel):
 
     @classmethod
     async def update_status(cls, db, order_id: str, order_status: str, payment_status: Optional[str] = None):
-        if not ObjectId.is_valid(order_id):
+        object_id = to_object_id(order_id)
+        if object_id is None:
             return None
-        update_data = {
-            "order_status": order_status,
-            "updated_at": datetime.utcnow()
-        }
+        update_data = {"order_status": order_status}
         if payment_status:
             update_data["payment_status"] = payment_status
-        await get_collection("orders").update_one(
-            {"_id": ObjectId(order_id)},
-            {"$set": update_data}
+        order_data = await get_collection("orders").find_one_and_update(
+            {"_id": object_id},
+            {"$set": update_data, "$currentDate": {"updated_at": True}},
+            return_document=ReturnDocument.AFTER,
         )
-        return await cls.get_by_id(db, order_id)
+        return cls(**order_data) if order_data else None
@@ -1,11 +1,31 @@
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 from datetime import datetime
-from pydantic import Field, EmailStr, validator
+from pydantic import ConfigDict, Field, EmailStr, PrivateAttr, StringConstraints, field_validator
+from pymongo import ReturnDocument
+from core.database import get_collection
 from models.base import TimestampedModel
+from utils.bson_utils import to_object_id
+
+# Build validators lazily on first use
+_BASE_CONFIG = ConfigDict(defer_build=True, populate_by_name=True)
+
+# Whitespace is stripped only from user-typed text; secrets such as password_hash stay byte-exact
+Name = Annotated[str, StringConstraints(strip_whitespace=True)]
+
+_users = None
+
+
+def _users_coll():
+    """Return the users collection, resolved once."""
+    global _users
+    if _users is None:
+        _users = get_collection("users")
+    return _users
 
 
 class Address(TimestampedModel):
     """User address model."""
+    model_config = ConfigDict(**_BASE_CONFIG, str_strip_whitespace=True)
     
     full_name: str = Field(...)
     address_line1: str = Field(...)
@@ -20,17 +40,27 @@ class Address(TimestampedModel):
 
 class User(TimestampedModel):
     """User model as stored in MongoDB."""
+    model_config = _BASE_CONFIG
     
     email: EmailStr = Field(...)
     password_hash: str = Field(...)  # Hashed password, never store plain passwords
-    first_name: str = Field(...)
-    last_name: str = Field(...)
+    first_name: Name = Field(...)
+    last_name: Name = Field(...)
     addresses: List[Address] = Field(default_factory=list)
     is_active: bool = Field(default=True)
     is_admin: bool = Field(default=False)
     last_login: Optional[datetime] = None
     
-    @validator('email')
+    _default_idx: Optional[int] = PrivateAttr(default=None)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the index of the default address."""
+        self._default_idx = next(
+            (i for i, addr in enumerate(self.addresses) if addr.is_default), None
+        )
+    
+    @field_validator('email')
+    @classmethod
     def email_lowercase(cls, v):
         """Convert email to lowercase."""
         return v.lower() if v else v
@@ -38,65 +68,66 @@ class User(TimestampedModel):
     @classmethod
     async def get_by_id(cls, db, user_id):
         """Get user by ID."""
-        from bson import ObjectId
-        from core.database import get_collection
-        
-        if not ObjectId.is_valid(user_id):
+        object_id = to_object_id(user_id)
+        if object_id is None:
             return None
             
-        user_data = await get_collection("users").find_one({"_id": ObjectId(user_id)})
+        user_data = await _users_coll().find_one({"_id": object_id})
         if user_data:
             return cls(**user_data)
         return None
     
     @classmethod
-    async def get_by_email(cls, db, email):
-        """Get user by email."""
-        from core.database import get_collection
+    async def get_by_email(cls, db, email, *, projection: Optional[dict] = None):
+        """Get user by email.
         
-        user_data = await get_collection("users").find_one({"email": email.lower()})
-        if user_data:
+        With a projection the raw (partial) document is returned instead of a User.
+        """
+        user_data = await _users_coll().find_one({"email": email.lower()}, projection=projection)
+        if user_data and projection is None:
             return cls(**user_data)
-        return None
+        return user_data
     
     @classmethod
     async def create(cls, db, user_data):
         """Create a new user."""
-        from core.database import get_collection
-        
         # Check if email already exists
-        existing = await cls.get_by_email(db, user_data["email"])
+        existing = await cls.get_by_email(db, user_data["email"], projection={"_id": 1})
         if existing:
             raise ValueError("Email already registered")
         
         user = cls(**user_data)
-        result = await get_collection("users").insert_one(user.dict(by_alias=True))
+        result = await _users_coll().insert_one(user.model_dump(by_alias=True, mode="python"))
         user.id = result.inserted_id
         return user
     
     @classmethod
     async def update(cls, db, user_id, user_data):
         """Update an existing user."""
-        from bson import ObjectId
-        from core.database import get_collection
-        
-        if not ObjectId.is_valid(user_id):
+        object_id = to_object_id(user_id)
+        if object_id is None:
             return None
             
-        user_data["updated_at"] = datetime.utcnow()
-        await get_collection("users").update_one(
-            {"_id": ObjectId(user_id)},
-            {"$set": user_data}
+        doc = await _users_coll().find_one_and_update(
+            {"_id": object_id},
+            {"$set": {**user_data, "updated_at": datetime.utcnow()}},
+            return_document=ReturnDocument.AFTER,
         )
-        return await cls.get_by_id(db, user_id)
+        return cls(**doc) if doc else None
     
     def has_default_address(self) -> bool:
         """Check if user has a default address."""
-        return any(addr.is_default for addr in self.addresses)
+        return self._default_idx is not None
     
     def get_default_address(self) -> Optional[Address]:
         """Get user's default address."""
-        for addr in self.addresses:
-            if addr.is_default:
-                return addr
-        return None if not self.addresses else self.addresses[0] 
\ No newline at end of file
+        if self._default_idx is not None:
+            return self.addresses[self._default_idx]
+        return self.addresses[0] if self.addresses else None
+    
+    def set_default_address(self, index: int) -> None:
+        """Mark the address at ``index`` as default and update the cached index."""
+        if self._default_idx is not None:
+            self.addresses[self._default_idx].is_default = False
+        self.addresses[index].is_default = True
+        self._default_idx = index
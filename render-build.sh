@@ -18,7 +18,8 @@ pip install --no-cache-dir --only-binary :all: \
   motor==3.1.2 \
   pymongo==4.3.3 \
   pydantic==2.4.2 \
-  python-dotenv==1.0.0
+  python-dotenv==1.0.0 \
+  orjson==3.9.10
 
 echo "🔁 Replacing v1 files with Pydantic v2 compatible versions if they exist..."
 
@@ -45,6 +46,7 @@ echo "📝 Creating minimal deployment app..."
 cat > main_deploy.py << 'EOF'
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Create FastAPI app
 app = FastAPI(
@@ -53,6 +55,7 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
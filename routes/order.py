@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
-from typing import Optional
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict
 from bson import ObjectId
 
-from core.database import get_database
 from schemas.order import (
     OrderCreate,
     OrderUpdate,
@@ -13,7 +13,8 @@ from schemas.order import (
 from schemas.common import MessageResponse
 from schemas.pagination import PaginationParams
 from services.order_service import OrderService
-from models.order import OrderStatus, PaymentStatus
+from services.deps import get_order_service
+from utils.bson_utils import is_object_id, parse_object_id
 
 router = APIRouter(
     prefix="/orders",
@@ -21,52 +22,49 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# The paginated response generic defers its build; this docs-only model is needed for the OpenAPI schema
+OrderPaginatedResponse.model_rebuild()
+
+def valid_order_id(order_id: str = Path(..., title="The ID of the order")) -> ObjectId:
+    """Validate the order ID path parameter and return it parsed."""
+    if not is_object_id(order_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid order ID format"
+        )
+    return parse_object_id(order_id)
+
 @router.post("/", response_model=OrderOut, status_code=status.HTTP_201_CREATED)
 async def create_order(
     order: OrderCreate,
-    db=Depends(get_database)
+    order_service: OrderService = Depends(get_order_service)
 ):
-    order_service = OrderService(db)
     try:
         return await order_service.create_order(order.dict())
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/", response_model=OrderPaginatedResponse)
+@router.get("/", response_model=None, responses={200: {"model": OrderPaginatedResponse}})
 async def list_orders(
     pagination: PaginationParams = Depends(),
-    user_id: Optional[str] = None,
-    order_status: Optional[OrderStatus] = None,
-    payment_status: Optional[PaymentStatus] = None,
-    min_total: Optional[float] = None,
-    max_total: Optional[float] = None,
-    date_from: Optional[str] = None,
-    date_to: Optional[str] = None,
-    db=Depends(get_database)
-):
-    order_service = OrderService(db)
-    filter_params = OrderFilter(
-        user_id=user_id,
-        order_status=order_status,
-        payment_status=payment_status,
-        min_total=min_total,
-        max_total=max_total,
-        date_from=date_from,
-        date_to=date_to
-    )
+    filter_params: OrderFilter = Depends(),
+    order_service: OrderService = Depends(get_order_service)
+) -> Dict[str, Any]:
     return await order_service.list_orders(pagination, filter_params)
 
-@router.get("/{order_id}", response_model=OrderOut)
+@router.get("/stream", response_class=StreamingResponse)
+async def stream_orders(
+    filter_params: OrderFilter = Depends(),
+    order_service: OrderService = Depends(get_order_service)
+) -> StreamingResponse:
+    """Stream all matching orders as newline-delimited JSON."""
+    return StreamingResponse(order_service.stream_orders(filter_params), media_type="application/x-ndjson")
+
+@router.get("/{order_id}", response_model=None, responses={200: {"model": OrderOut}})
 async def get_order(
-    order_id: str = Path(..., title="The ID of the order to get"),
-    db=Depends(get_database)
-):
-    if not ObjectId.is_valid(order_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID format"
-        )
-    order_service = OrderService(db)
+    order_id: ObjectId = Depends(valid_order_id),
+    order_service: OrderService = Depends(get_order_service)
+) -> OrderOut:
     order = await order_service.get_order_by_id(order_id)
     if not order:
         raise HTTPException(
@@ -75,37 +73,25 @@ async def get_order(
         )
     return order
 
-@router.patch("/{order_id}", response_model=OrderOut)
+@router.patch("/{order_id}", response_model=None, responses={200: {"model": OrderOut}})
 async def update_order_status(
     order_update: OrderUpdate,
-    order_id: str = Path(..., title="The ID of the order to update"),
-    db=Depends(get_database)
-):
-    if not ObjectId.is_valid(order_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID format"
-        )
-    order_service = OrderService(db)
-    success = await order_service.update_order_status(order_id, order_update.status)
-    if not success:
+    order_id: ObjectId = Depends(valid_order_id),
+    order_service: OrderService = Depends(get_order_service)
+) -> OrderOut:
+    order = await order_service.update_order_status(order_id, order_update.status)
+    if not order:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found"
         )
-    return await order_service.get_order_by_id(order_id)
+    return order
 
 @router.delete("/{order_id}", response_model=MessageResponse)
 async def cancel_order(
-    order_id: str = Path(..., title="The ID of the order to cancel"),
-    db=Depends(get_database)
+    order_id: ObjectId = Depends(valid_order_id),
+    order_service: OrderService = Depends(get_order_service)
 ):
-    if not ObjectId.is_valid(order_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID format"
-        )
-    order_service = OrderService(db)
     cancelled = await order_service.delete_order(order_id)
     if not cancelled:
         raise HTTPException(
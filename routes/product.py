@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
-from typing import List, Optional
+from typing import Any, Dict, List
 from bson import ObjectId
 
-from core.database import get_database
 from schemas.product import (
     ProductCreate, 
     ProductUpdate, 
@@ -13,6 +12,9 @@ from schemas.product import (
 from schemas.common import MessageResponse
 from schemas.pagination import PaginationParams
 from services.product_service import ProductService
+from services.deps import get_product_service
+from utils.bson_utils import is_object_id, parse_object_id
+from utils.helpers import log_api_call
 
 
 router = APIRouter(
@@ -21,31 +23,35 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# The paginated response generic defers its build; this docs-only model is needed for the OpenAPI schema
+ProductPaginatedResponse.model_rebuild()
+
+
+def valid_product_id(product_id: str = Path(..., title="The ID of the product")) -> ObjectId:
+    """Validate the product ID path parameter and return it parsed."""
+    if not is_object_id(product_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid product ID format"
+        )
+    return parse_object_id(product_id)
+
 
 @router.post("/", response_model=ProductOut, status_code=status.HTTP_201_CREATED)
 async def create_product(
     product: ProductCreate,
-    db = Depends(get_database)
+    product_service: ProductService = Depends(get_product_service)
 ):
     """Create a new product."""
-    product_service = ProductService(db)
     return await product_service.create_product(product)
 
 
-@router.get("/", response_model=ProductPaginatedResponse)
+@router.get("/", response_model=None, responses={200: {"model": ProductPaginatedResponse}})
 async def list_products(
     pagination: PaginationParams = Depends(),
-    category: Optional[str] = None,
-    brand: Optional[str] = None,
-    min_price: Optional[float] = None,
-    max_price: Optional[float] = None,
-    size: Optional[str] = None,
-    in_stock: Optional[bool] = None,
-    search: Optional[str] = None,
-    sort_by: Optional[str] = None,
-    sort_order: str = "asc",
-    db = Depends(get_database)
-):
+    filter_params: ProductFilter = Depends(),
+    product_service: ProductService = Depends(get_product_service)
+) -> Dict[str, Any]:
     """
     Get a paginated list of products with optional filtering.
     
@@ -60,37 +66,31 @@ async def list_products(
     - **sort_by**: Field to sort by (name, price, created_at)
     - **sort_order**: Sort order (asc or desc)
     """
-    product_service = ProductService(db)
-    
-    # Create filter from query params
-    filter_params = ProductFilter(
-        category=category,
-        brand=brand,
-        min_price=min_price,
-        max_price=max_price,
-        size=size,
-        in_stock=in_stock,
-        search=search,
-        sort_by=sort_by,
-        sort_order=sort_order
-    )
-    
     return await product_service.list_products(pagination, filter_params)
 
 
-@router.get("/{product_id}", response_model=ProductOut)
+@router.get("/search/{search_term}", response_model=None, responses={200: {"model": List[ProductOut]}})
+async def search_products(
+    search_term: str,
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    product_service: ProductService = Depends(get_product_service)
+) -> List[ProductOut]:
+    """
+    Search products by name, description and tags.
+    
+    - **search_term**: Text to search for
+    - **limit**: Maximum number of results to return (1-50, default: 10)
+    """
+    log_api_call("/products/search/{term}", "GET", search_term=search_term, limit=limit)
+    return await product_service.search_products(search_term, limit)
+
+
+@router.get("/{product_id}", response_model=None, responses={200: {"model": ProductOut}})
 async def get_product(
-    product_id: str = Path(..., title="The ID of the product to get"),
-    db = Depends(get_database)
-):
+    product_id: ObjectId = Depends(valid_product_id),
+    product_service: ProductService = Depends(get_product_service)
+) -> ProductOut:
     """Get a product by ID."""
-    if not ObjectId.is_valid(product_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid product ID format"
-        )
-        
-    product_service = ProductService(db)
     product = await product_service.get_product(product_id)
     
     if not product:
@@ -102,20 +102,13 @@ async def get_product(
     return product
 
 
-@router.put("/{product_id}", response_model=ProductOut)
+@router.put("/{product_id}", response_model=None, responses={200: {"model": ProductOut}})
 async def update_product(
     product_update: ProductUpdate,
-    product_id: str = Path(..., title="The ID of the product to update"),
-    db = Depends(get_database)
-):
+    product_id: ObjectId = Depends(valid_product_id),
+    product_service: ProductService = Depends(get_product_service)
+) -> ProductOut:
     """Update a product."""
-    if not ObjectId.is_valid(product_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid product ID format"
-        )
-        
-    product_service = ProductService(db)
     product = await product_service.update_product(product_id, product_update)
     
     if not product:
@@ -129,17 +122,10 @@ async def update_product(
 
 @router.delete("/{product_id}", response_model=MessageResponse)
 async def delete_product(
-    product_id: str = Path(..., title="The ID of the product to delete"),
-    db = Depends(get_database)
+    product_id: ObjectId = Depends(valid_product_id),
+    product_service: ProductService = Depends(get_product_service)
 ):
     """Delete a product."""
-    if not ObjectId.is_valid(product_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid product ID format"
-        )
-        
-    product_service = ProductService(db)
     deleted = await product_service.delete_product(product_id)
     
     if not deleted:
@@ -1,7 +1,10 @@
 from typing import Generic, TypeVar, List, Optional, Dict, Any, Annotated
-from pydantic import BaseModel, Field, BeforeValidator
+from pydantic import BaseModel, ConfigDict, Field, BeforeValidator
 from pydantic.generics import GenericModel
 
+from utils.bson_utils import is_object_id
+from utils.pagination import ceildiv
+
 
 # Generic type for paginated responses
 T = TypeVar('T')
@@ -33,11 +36,12 @@ class PaginationMeta(BaseModel):
     total_pages: int = Field(..., description="Total number of pages")
     has_previous: bool = Field(..., description="Whether there is a previous page")
     has_next: bool = Field(..., description="Whether there is a next page")
+    next_cursor: Optional[str] = Field(None, description="Value to pass as after to fetch the next page")
     
     @classmethod
     def create(cls, params: PaginationParams, total_items: int) -> "PaginationMeta":
         """Create pagination metadata."""
-        total_pages = (total_items + params.page_size - 1) // params.page_size if total_items > 0 else 0
+        total_pages = ceildiv(total_items, params.page_size) if total_items > 0 else 0
         
         return cls(
             page=params.page,
@@ -52,6 +56,9 @@ class PaginationMeta(BaseModel):
 class PaginatedResponse(GenericModel, Generic[T]):
     """Generic paginated response."""
     
+    # Only the concrete parametrizations are ever used; don't build a schema for the bare generic
+    model_config = ConfigDict(defer_build=True)
+
     items: List[T] = Field(..., description="List of items")
     meta: PaginationMeta = Field(..., description="Pagination metadata")
     
@@ -79,9 +86,7 @@ class ErrorResponse(BaseModel):
 
 def validate_object_id(v: Any) -> str:
     """Validate that a string is a valid MongoDB ObjectId."""
-    from bson import ObjectId
-    
-    if not ObjectId.is_valid(v):
+    if not is_object_id(v):
         raise ValueError("Invalid ObjectId")
     return str(v)
 
@@ -1,5 +1,8 @@
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+from functools import cached_property
+from typing import Annotated, List, Optional, Dict, Any
+from pydantic import BaseModel, BeforeValidator, Field, TypeAdapter, field_validator
+from schemas import pagination
 from schemas.common_v2 import ObjectIdStr, PaginatedResponse
 from models.order_v2 import OrderStatus, PaymentStatus
 
@@ -83,14 +86,22 @@ class OrderOut(BaseModel):
     total: float
     tracking_number: Optional[str] = None
     notes: Optional[str] = None
-    created_at: str
-    updated_at: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
     
     model_config = {
         "from_attributes": True
     }
 
 
+def _parse_filter_date(value: Any) -> Any:
+    # fromisoformat also takes bare dates (2024-01-31), which pydantic's datetime parser rejects
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+FilterDate = Annotated[datetime, BeforeValidator(_parse_filter_date)]
+
+
 class OrderFilter(BaseModel):
     """Schema for filtering orders."""
     
@@ -99,11 +110,38 @@ class OrderFilter(BaseModel):
     payment_status: Optional[PaymentStatus] = None
     min_total: Optional[float] = Field(None, ge=0)
     max_total: Optional[float] = Field(None, gt=0)
-    date_from: Optional[str] = None
-    date_to: Optional[str] = None
+    # Parsed to datetimes so the created_at range is compared as BSON dates and can use the index
+    date_from: Optional[FilterDate] = None
+    date_to: Optional[FilterDate] = None
+
+    @cached_property
+    def mongo_query(self) -> Dict[str, Any]:
+        """MongoDB filter for these params, assembled once per request."""
+        query: Dict[str, Any] = {}
+        if self.user_id:
+            query["user_id"] = self.user_id
+        if self.order_status:
+            query["status"] = self.order_status
+        if self.payment_status:
+            query["payment_status"] = self.payment_status
+        if self.min_total is not None:
+            query.setdefault("total_amount", {})["$gte"] = self.min_total
+        if self.max_total is not None:
+            query.setdefault("total_amount", {})["$lte"] = self.max_total
+        if self.date_from:
+            query.setdefault("created_at", {})["$gte"] = self.date_from
+        if self.date_to:
+            query.setdefault("created_at", {})["$lte"] = self.date_to
+        return query
 
 
 class OrderPaginatedResponse(PaginatedResponse):
     """Schema for paginated order response."""
     
-    items: List[OrderOut] 
\ No newline at end of file
+    items: List[OrderOut]
+
+
+# Concrete page type and adapter, parametrized and built once at import rather than per request
+OrderPage = pagination.PaginatedResponse[OrderOut]
+OrderPage.model_rebuild()
+OrderListAdapter = TypeAdapter(OrderPage)
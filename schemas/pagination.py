@@ -1,15 +1,32 @@
-from typing import Generic, TypeVar, List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+import base64
+from datetime import datetime
+from typing import Generic, TypeVar, List, Optional, Dict, Any, FrozenSet, Tuple
+from bson import ObjectId
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic.generics import GenericModel
 
+from utils.bson_utils import is_object_id, parse_object_id
+from utils.pagination import ceildiv
+
 # Generic type for paginated responses
 T = TypeVar('T')
 
+# Largest offset served through skip(); deeper pages must use the after cursor
+MAX_SKIP = 10000
+
+# Newest first, with _id breaking ties so the after cursor always names a unique position
+KEYSET_SORT = [("created_at", -1), ("_id", -1)]
+
+# Upper bound on how long a filtered total count may run before the list request fails
+COUNT_MAX_TIME_MS = 500
+
 
 class PaginationParams(BaseModel):
     """Query parameters for pagination."""
     page: int = Field(1, ge=1, description="Page number, starting from 1")
     page_size: int = Field(10, ge=1, le=100, description="Number of items per page")
+    after: Optional[str] = Field(None, description="Return items after this cursor (meta.next_cursor of the previous page)")
+    fields: Optional[str] = Field(None, description="Comma-separated item fields to return (default: all)")
 
     @property
     def skip(self) -> int:
@@ -21,6 +38,13 @@ class PaginationParams(BaseModel):
         """Limit to be used in MongoDB limit()."""
         return self.page_size
 
+    @property
+    def field_set(self) -> Optional[FrozenSet[str]]:
+        """Requested item fields, or None for all of them."""
+        if not self.fields:
+            return None
+        return frozenset(name for name in map(str.strip, self.fields.split(",")) if name)
+
     def to_mongo_query(self) -> Dict[str, int]:
         """Convert pagination parameters to MongoDB query options."""
         return {
@@ -29,6 +53,48 @@ class PaginationParams(BaseModel):
         }
 
 
+def encode_cursor(doc: Dict[str, Any]) -> Optional[str]:
+    """Opaque cursor for the (created_at, _id) position of a document, if it has one."""
+    created_at = doc.get("created_at")
+    if not isinstance(created_at, datetime):
+        return None
+    raw = f"{created_at.isoformat()}|{doc['_id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Optional[Tuple[datetime, ObjectId]]:
+    """Inverse of encode_cursor; None if the cursor is malformed."""
+    try:
+        created_at, _id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        if not is_object_id(_id):
+            return None
+        return datetime.fromisoformat(created_at), parse_object_id(_id)
+    except ValueError:
+        return None
+
+
+def keyset_filter(query: Dict[str, Any], position: Tuple[datetime, ObjectId]) -> Dict[str, Any]:
+    """Restrict query to documents after position in KEYSET_SORT order."""
+    created_at, _id = position
+    after = {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "_id": {"$lt": _id}},
+    ]}
+    return {"$and": [query, after]} if query else after
+
+
+def field_projection(fields: FrozenSet[str], sources: Dict[str, Tuple[str, ...]]) -> Dict[str, int]:
+    """Mongo projection for the requested item fields plus the keys paging relies on.
+
+    sources maps an output field to the stored keys it is built from, when those differ.
+    """
+    projection = {"_id": 1, "created_at": 1}
+    for name in fields:
+        for source in sources.get(name, (name,)):
+            projection[source] = 1
+    return projection
+
+
 class PaginationMeta(BaseModel):
     """Metadata for paginated responses."""
     page: int
@@ -37,10 +103,11 @@ class PaginationMeta(BaseModel):
     total_pages: int
     has_previous: bool
     has_next: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def create(cls, params: PaginationParams, total_items: int) -> "PaginationMeta":
-        total_pages = (total_items + params.page_size - 1) // params.page_size if total_items > 0 else 1
+    def create(cls, params: PaginationParams, total_items: int, next_cursor: Optional[str] = None) -> "PaginationMeta":
+        total_pages = ceildiv(total_items, params.page_size) if total_items > 0 else 1
 
         return cls(
             page=params.page,
@@ -48,18 +115,27 @@ class PaginationMeta(BaseModel):
             total_items=total_items,
             total_pages=total_pages,
             has_previous=params.page > 1,
-            has_next=params.page < total_pages
+            has_next=params.page < total_pages,
+            next_cursor=next_cursor
         )
 
 
 class PaginatedResponse(GenericModel, Generic[T]):
     """Generic paginated API response wrapper."""
+    # Only the concrete parametrizations are ever used; don't build a schema for the bare generic
+    model_config = ConfigDict(defer_build=True)
     items: List[T]
     meta: PaginationMeta
 
     @classmethod
-    def create(cls, items: List[T], params: PaginationParams, total_items: int) -> "PaginatedResponse[T]":
+    def create(
+        cls,
+        items: List[T],
+        params: PaginationParams,
+        total_items: int,
+        next_cursor: Optional[str] = None
+    ) -> "PaginatedResponse[T]":
         return cls(
             items=items,
-            meta=PaginationMeta.create(params, total_items)
+            meta=PaginationMeta.create(params, total_items, next_cursor)
         )
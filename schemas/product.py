@@ -1,9 +1,32 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+import re
+from functools import cached_property
+from typing import Annotated, Any, Dict, List, Optional
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter, field_validator
 from datetime import datetime
 
+from schemas import pagination
 from schemas.common import ObjectIdStr, PaginatedResponse
 
+# Characters that make a search string a regular expression rather than plain words
+_REGEX_META = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+# Build validators lazily on first use and strip surrounding whitespace from strings
+_BASE_CONFIG = ConfigDict(defer_build=True, populate_by_name=True, str_strip_whitespace=True)
+
+# Trimmed, non-empty product name, checked entirely inside pydantic-core
+Name = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=255)]
+
+
+def _whole_cents(v: float) -> float:
+    # Integer cents round-trip; round(v, 2) goes through a correctly-rounded decimal conversion
+    if int(v * 100 + 0.5) / 100 != v:
+        raise ValueError("Price must have at most 2 decimal places")
+    return v
+
+
+# Positive price with at most two decimals; the sign check stays in pydantic-core
+Price = Annotated[float, Field(gt=0), AfterValidator(_whole_cents)]
+
 
 # ---------------------------
 # Product Sizes
@@ -11,6 +34,8 @@ from schemas.common import ObjectIdStr, PaginatedResponse
 
 class ProductSizeBase(BaseModel):
     """Base schema for product size."""
+    model_config = _BASE_CONFIG
+
     size: str = Field(..., description="Size identifier (e.g., 'S', 'M', 'L', '42', etc.)")
     stock: int = Field(..., ge=0, description="Available quantity in stock")
 
@@ -22,6 +47,8 @@ class ProductSizeCreate(ProductSizeBase):
 
 class ProductSizeUpdate(BaseModel):
     """Schema for updating a product size."""
+    model_config = _BASE_CONFIG
+
     size: Optional[str] = None
     stock: Optional[int] = Field(None, ge=0)
 
@@ -37,6 +64,8 @@ class ProductSizeOut(ProductSizeBase):
 
 class ProductBase(BaseModel):
     """Base schema for product."""
+    model_config = _BASE_CONFIG
+
     name: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=1)
     price: float = Field(..., gt=0)
@@ -53,35 +82,21 @@ class ProductBase(BaseModel):
 class ProductCreate(ProductBase):
     image_urls: List[str] = Field(default_factory=list)
     sizes: List[ProductSizeCreate] = Field(default_factory=list)
-
-    @validator('price')
-    def validate_price(cls, v):
-        if v <= 0:
-            raise ValueError("Price must be positive")
-        if round(v, 2) != v:
-            raise ValueError("Price must have at most 2 decimal places")
-        return v
+    price: Price
 
 
 class ProductUpdate(BaseModel):
+    model_config = _BASE_CONFIG
+
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
-    price: Optional[float] = Field(None, gt=0)
+    price: Optional[Price] = None
     category: Optional[str] = None
     brand: Optional[str] = None
     image_urls: Optional[List[str]] = None
     tags: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
-    @validator('price')
-    def validate_price(cls, v):
-        if v is not None:
-            if v <= 0:
-                raise ValueError("Price must be positive")
-            if round(v, 2) != v:
-                raise ValueError("Price must have at most 2 decimal places")
-        return v
-
 
 # ---------------------------
 # Product Out (Response)
@@ -96,8 +111,7 @@ class ProductOut(ProductBase):
     created_at: datetime  # ✅ Correct datetime type
     updated_at: Optional[datetime] = None  # ✅ Supports null
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ---------------------------
@@ -106,6 +120,9 @@ class ProductOut(ProductBase):
 
 class ProductFilter(BaseModel):
     """Schema for filtering products."""
+    # Not deferred: FastAPI reads the field signature to expose these as query params
+    model_config = ConfigDict(populate_by_name=True, str_strip_whitespace=True)
+
     category: Optional[str] = None
     brand: Optional[str] = None
     min_price: Optional[float] = Field(None, ge=0)
@@ -116,7 +133,173 @@ class ProductFilter(BaseModel):
     sort_by: Optional[str] = Field(None, description="Field to sort by (e.g., price, name)")
     sort_order: Optional[str] = Field("asc", description="Sort order (asc or desc)")
 
+    @cached_property
+    def mongo_query(self) -> Dict[str, Any]:
+        """MongoDB filter for these params, assembled once per request."""
+        query: Dict[str, Any] = {}
+        alternatives = []
+
+        if self.category:
+            query["category"] = self.category
+        if self.brand:
+            query["brand"] = self.brand
+        if self.min_price is not None:
+            query.setdefault("price", {})["$gte"] = self.min_price
+        if self.max_price is not None:
+            query.setdefault("price", {})["$lte"] = self.max_price
+        if self.size:
+            query["sizes.size"] = self.size
+        if self.in_stock:
+            query["sizes"] = {"$elemMatch": {"stock": {"$gt": 0}}}
+        elif self.in_stock is not None:
+            alternatives.append([
+                {"sizes": {"$size": 0}},
+                {"sizes": {"$not": {"$elemMatch": {"stock": {"$gt": 0}}}}}
+            ])
+        if self.search and not _REGEX_META.search(self.search):
+            # Plain words go through the text index on name, description and tags
+            query["$text"] = {"$search": self.search}
+        elif self.search:
+            alternatives.append([
+                {"name": {"$regex": self.search, "$options": "i"}},
+                {"description": {"$regex": self.search, "$options": "i"}},
+                {"tags": {"$in": [self.search]}}
+            ])
+
+        # Several $or groups must all hold, so they are combined under $and
+        if len(alternatives) == 1:
+            query["$or"] = alternatives[0]
+        elif alternatives:
+            query["$and"] = [{"$or": group} for group in alternatives]
+        return query
+
 
 class ProductPaginatedResponse(PaginatedResponse):
     """Schema for paginated product response."""
     items: List[ProductOut]
+
+
+
+# Concrete page type and adapter, parametrized and built once at import rather than per request
+ProductPage = pagination.PaginatedResponse[ProductOut]
+ProductPage.model_rebuild()
+ProductListAdapter = TypeAdapter(ProductPage)
+
+
+# ---------------------------
+# Product API (name/price/sizes) schemas
+# ---------------------------
+
+class ProductSizeSchema(BaseModel):
+    """Schema for product size."""
+    size: str = Field(..., min_length=1, max_length=50, description="Size name")
+    quantity: int = Field(default=0, ge=0, description="Available quantity")
+    
+    model_config = ConfigDict(**_BASE_CONFIG, json_schema_extra={
+        "example": {
+            "size": "large",
+            "quantity": 100
+        }
+    })
+
+
+class ProductCreateSchema(BaseModel):
+    """Schema for creating a new product."""
+    name: Name = Field(..., description="Product name")
+    price: float = Field(..., gt=0, description="Product price")
+    sizes: List[ProductSizeSchema] = Field(..., min_length=1, description="Product sizes and quantities")
+    
+    @field_validator('sizes', mode='after')
+    @classmethod
+    def validate_sizes(cls, v):
+        if not v:
+            raise ValueError('At least one size must be provided')
+        
+        # Check for duplicate sizes, stopping at the first repeat
+        seen = set()
+        for s in v:
+            key = s.size.lower()
+            if key in seen:
+                raise ValueError('Duplicate sizes are not allowed')
+            seen.add(key)
+        
+        return v
+    
+    model_config = ConfigDict(**_BASE_CONFIG, json_schema_extra={
+        "example": {
+            "name": "Premium Cotton T-Shirt",
+            "price": 29.99,
+            "sizes": [
+                {"size": "small", "quantity": 50},
+                {"size": "medium", "quantity": 75},
+                {"size": "large", "quantity": 100}
+            ]
+        }
+    })
+
+
+class ProductResponseSchema(BaseModel):
+    """Schema for product response."""
+    id: str = Field(..., description="Product ID")
+    name: str = Field(..., description="Product name")
+    price: float = Field(..., description="Product price")
+    sizes: List[ProductSizeSchema] = Field(..., description="Product sizes")
+    
+    model_config = ConfigDict(**_BASE_CONFIG, json_schema_extra={
+        "example": {
+            "id": "507f1f77bcf86cd799439011",
+            "name": "Premium Cotton T-Shirt",
+            "price": 29.99,
+            "sizes": [
+                {"size": "small", "quantity": 50},
+                {"size": "medium", "quantity": 75},
+                {"size": "large", "quantity": 100}
+            ]
+        }
+    })
+
+
+class ProductListResponseSchema(BaseModel):
+    """Schema for product list response with pagination."""
+    data: List[ProductResponseSchema] = Field(..., description="List of products")
+    page: dict = Field(..., description="Pagination information")
+    
+    model_config = ConfigDict(**_BASE_CONFIG, json_schema_extra={
+        "example": {
+            "data": [
+                {
+                    "id": "507f1f77bcf86cd799439011",
+                    "name": "Premium Cotton T-Shirt",
+                    "price": 29.99,
+                    "sizes": [{"size": "large", "quantity": 100}]
+                }
+            ],
+            "page": {
+                "next": "10",
+                "limit": 0,
+                "previous": "-10"
+            }
+        }
+    })
+
+
+class ProductUpdateSchema(BaseModel):
+    """Schema for updating a product."""
+    model_config = _BASE_CONFIG
+
+    name: Optional[Name] = Field(None, description="Product name")
+    price: Optional[float] = Field(None, gt=0, description="Product price")
+    sizes: Optional[List[ProductSizeSchema]] = Field(None, description="Product sizes")
+    
+    @field_validator('sizes', mode='after')
+    @classmethod
+    def validate_sizes(cls, v):
+        if v is not None:
+            # Check for duplicate sizes, stopping at the first repeat
+            seen = set()
+            for s in v:
+                key = s.size.lower()
+                if key in seen:
+                    raise ValueError('Duplicate sizes are not allowed')
+                seen.add(key)
+        return v
@@ -1,9 +1,8 @@
-# Create schemas/response.py
-response_schema_content = '''"""
+"""
 Common response schemas for the API.
 """
 from typing import Any, List, Optional, Dict, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SuccessResponse(BaseModel):
@@ -11,13 +10,12 @@ class SuccessResponse(BaseModel):
     message: str = Field(..., description="Success message")
     data: Optional[Any] = Field(None, description="Response data")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "message": "Operation completed successfully",
-                "data": {"id": "507f1f77bcf86cd799439011"}
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "message": "Operation completed successfully",
+            "data": {"id": "507f1f77bcf86cd799439011"}
         }
+    })
 
 
 class ErrorResponse(BaseModel):
@@ -26,14 +24,13 @@ class ErrorResponse(BaseModel):
     message: str = Field(..., description="Error message")
     details: Optional[Dict[str, Any]] = Field(None, description="Error details")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "error": "ValidationError",
-                "message": "Invalid input data",
-                "details": {"field": "name", "issue": "required field missing"}
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error": "ValidationError",
+            "message": "Invalid input data",
+            "details": {"field": "name", "issue": "required field missing"}
         }
+    })
 
 
 class PaginationInfo(BaseModel):
@@ -42,14 +39,13 @@ class PaginationInfo(BaseModel):
     limit: int = Field(..., description="Items per page limit")
     previous: Optional[str] = Field(None, description="Previous page offset")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "next": "10",
-                "limit": 10,
-                "previous": None
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "next": "10",
+            "limit": 10,
+            "previous": None
         }
+    })
 
 
 class PaginatedResponse(BaseModel):
@@ -58,18 +54,17 @@ class PaginatedResponse(BaseModel):
     page: PaginationInfo = Field(..., description="Pagination information")
     total_count: Optional[int] = Field(None, description="Total number of items")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "data": [],
-                "page": {
-                    "next": "10",
-                    "limit": 10,
-                    "previous": None
-                },
-                "total_count": 25
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "data": [],
+            "page": {
+                "next": "10",
+                "limit": 10,
+                "previous": None
+            },
+            "total_count": 25
         }
+    })
 
 
 class CreatedResponse(BaseModel):
@@ -77,11 +72,9 @@ class CreatedResponse(BaseModel):
     id: str = Field(..., description="ID of the created resource")
     message: str = Field(default="Resource created successfully", description="Success message")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "id": "507f1f77bcf86cd799439011",
-                "message": "Resource created successfully"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "id": "507f1f77bcf86cd799439011",
+            "message": "Resource created successfully"
         }
-'''
\ No newline at end of file
+    })
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from fastapi import Depends
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from core.database import get_database
+from services.order_service import OrderService
+from services.product_service import ProductService
+
+# One service instance per database handle; rebuilt if the handle changes (e.g. reconnect)
+_product_service: Optional[ProductService] = None
+_order_service: Optional[OrderService] = None
+
+
+def get_product_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> ProductService:
+    """Return the shared ProductService for the current database."""
+    global _product_service
+    if _product_service is None or _product_service.db is not db:
+        _product_service = ProductService(db)
+    return _product_service
+
+
+def get_order_service(db: AsyncIOMotorDatabase = Depends(get_database)) -> OrderService:
+    """Return the shared OrderService for the current database."""
+    global _order_service
+    if _order_service is None or _order_service.db is not db:
+        _order_service = OrderService(db)
+    return _order_service
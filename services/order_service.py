@@ -1,18 +1,54 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import orjson
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from bson import ObjectId
 from fastapi import HTTPException
+from pymongo import ReturnDocument
 
 from utils.helpers import convert_objectid, calculate_total_amount, ValidationHelper
 from models.order import order_helper, get_order_lookup_pipeline, OrderStatus, PaymentStatus
-from schemas.order import OrderFilter
-from schemas.pagination import PaginationParams, PaginatedResponse
+from schemas.order import OrderFilter, OrderItemOut, OrderOut, OrderListAdapter, OrderPage, ShippingAddressBase
+from schemas.pagination import (
+    PaginationParams, PaginationMeta, MAX_SKIP, COUNT_MAX_TIME_MS, KEYSET_SORT,
+    decode_cursor, encode_cursor, field_projection, keyset_filter
+)
 from services.product_service import ProductService
+from utils.bson_utils import is_object_id, json_default, parse_object_id
 
 logger = logging.getLogger(__name__)
 
 
+def _to_order_out(doc: Dict[str, Any], _item=OrderItemOut.model_construct,
+                  _address=ShippingAddressBase.model_construct,
+                  _order=OrderOut.model_construct) -> OrderOut:
+    """Build an OrderOut from a stored order without re-validating it (validated on write)."""
+    order = order_helper(doc)
+    order["items"] = [_item(**item) for item in order["items"]]
+    order["shipping_address"] = _address(**order["shipping_address"])
+    return _order(**order)
+
+
+_STATUS_CHOICES = ", ".join(member.value for member in OrderStatus)
+
+
+def _parse_status(status: str) -> str:
+    """Validated order status value, or a 400 naming the allowed ones."""
+    try:
+        return OrderStatus(status).value
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {_STATUS_CHOICES}")
+
+
+# OrderOut fields built from stored keys of another name (see order_helper)
+_ORDER_FIELD_SOURCES = {
+    "id": ("_id",),
+    "order_status": ("order_status", "status"),
+    "total": ("total", "total_amount"),
+}
+
+
 class OrderService:
     def __init__(self, db):
         self.db = db
@@ -34,21 +70,25 @@ class OrderService:
             # Create a map of products for easy lookup
             product_map = {str(p["_id"]): p for p in existing_products}
             
-            # Enrich order items with product information
-            subtotal = 0.0
+            # Enrich order items with product information and total them in the same pass.
+            # Money is summed in integer cents so the totals carry no float drift.
+            subtotal_cents = 0
             for item in validated_data["items"]:
-                product = product_map.get(item["product_id"])
-                if product:
-                    item["product_name"] = product.get("name", "Unknown Product")
-                    item["price"] = float(product.get("price", 0))
-                    item["subtotal"] = round(item["price"] * item["quantity"], 2)
-                    subtotal += item["subtotal"]
+                product = product_map[item["product_id"]]
+                price = float(product.get("price", 0))
+                line_cents = round(price * 100) * item["quantity"]
+                item["product_name"] = product.get("name", "Unknown Product")
+                item["price"] = price
+                item["subtotal"] = line_cents / 100
+                subtotal_cents += line_cents
             
             # Set order totals
-            validated_data["subtotal"] = subtotal
-            validated_data["shipping_cost"] = validated_data.get("shipping_cost", 0.0)
-            validated_data["tax"] = validated_data.get("tax", 0.0)
-            validated_data["total"] = round(subtotal + validated_data["shipping_cost"] + validated_data["tax"], 2)
+            shipping_cost = validated_data.get("shipping_cost", 0.0)
+            tax = validated_data.get("tax", 0.0)
+            validated_data["subtotal"] = subtotal_cents / 100
+            validated_data["shipping_cost"] = shipping_cost
+            validated_data["tax"] = tax
+            validated_data["total"] = (subtotal_cents + round(shipping_cost * 100) + round(tax * 100)) / 100
             validated_data["order_status"] = OrderStatus.PENDING
             validated_data["payment_status"] = PaymentStatus.PENDING
             validated_data["created_at"] = datetime.utcnow()
@@ -58,8 +98,8 @@ class OrderService:
             if not result.inserted_id:
                 raise HTTPException(status_code=500, detail="Failed to create order")
 
-            created_order = await self.collection.find_one({"_id": result.inserted_id})
-            return order_helper(created_order)
+            # The inserted document is exactly what we sent; no need to read it back
+            return order_helper({**validated_data, "_id": result.inserted_id})
 
         except HTTPException:
             raise
@@ -67,91 +107,130 @@ class OrderService:
             logger.error(f"Error creating order: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
 
+    def _count(self, query: Dict[str, Any]):
+        # An unfiltered total comes from collection metadata instead of an index scan
+        if not query:
+            return self.collection.estimated_document_count()
+        return self.collection.count_documents(query, maxTimeMS=COUNT_MAX_TIME_MS)
+
     async def list_orders(
         self,
         pagination: PaginationParams,
         filters: OrderFilter
-    ) -> PaginatedResponse:
+    ) -> Dict[str, Any]:
         try:
-            query: Dict[str, Any] = {}
-
-            if filters.user_id:
-                query["user_id"] = filters.user_id
-
-            if filters.order_status:
-                query["status"] = filters.order_status
-
-            if filters.payment_status:
-                query["payment_status"] = filters.payment_status
-
-            if filters.min_total is not None:
-                query["total_amount"] = query.get("total_amount", {})
-                query["total_amount"]["$gte"] = filters.min_total
-
-            if filters.max_total is not None:
-                query["total_amount"] = query.get("total_amount", {})
-                query["total_amount"]["$lte"] = filters.max_total
-
-            if filters.date_from or filters.date_to:
-                query["created_at"] = {}
-                if filters.date_from:
-                    query["created_at"]["$gte"] = filters.date_from
-                if filters.date_to:
-                    query["created_at"]["$lte"] = filters.date_to
-
-            total_items = await self.collection.count_documents(query)
-
-            cursor = (
-                self.collection.find(query)
-                .sort("created_at", -1)
-                .skip(pagination.skip)
-                .limit(pagination.limit)
+            query = filters.mongo_query
+
+            fields = pagination.field_set
+            projection = None
+            if fields:
+                unknown = fields - OrderOut.model_fields.keys()
+                if unknown:
+                    raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+                projection = field_projection(fields, _ORDER_FIELD_SOURCES)
+
+            if pagination.after:
+                # Keyset pagination: seek past the cursor on (created_at, _id) instead of skipping
+                position = decode_cursor(pagination.after)
+                if position is None:
+                    raise HTTPException(status_code=400, detail="Invalid after cursor")
+                cursor = (
+                    self.collection.find(keyset_filter(query, position), projection)
+                    .sort(KEYSET_SORT)
+                    .limit(pagination.limit)
+                )
+            else:
+                if pagination.skip > MAX_SKIP:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Offset exceeds {MAX_SKIP}; use after to page further"
+                    )
+                cursor = (
+                    self.collection.find(query, projection)
+                    .sort(KEYSET_SORT)
+                    .skip(pagination.skip)
+                    .limit(pagination.limit)
+                )
+            total_items, docs = await asyncio.gather(
+                self._count(query),
+                cursor.to_list(length=pagination.limit),
             )
+            next_cursor = encode_cursor(docs[-1]) if len(docs) == pagination.limit else None
 
-            orders: List[Dict[str, Any]] = []
-            async for doc in cursor:
-                orders.append(order_helper(doc))
+            orders = [_to_order_out(doc) for doc in docs]
 
-            return PaginatedResponse.create(
+            page = OrderPage.model_construct(
                 items=orders,
-                params=pagination,
-                total_items=total_items
+                meta=PaginationMeta.create(pagination, total_items, next_cursor)
             )
+            include = {"items": {"__all__": fields}, "meta": True} if fields else None
+            return OrderListAdapter.dump_python(page, mode="json", include=include, exclude_none=True)
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error listing orders: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
 
-    async def get_order_by_id(self, order_id: str) -> Optional[Dict[str, Any]]:
+    async def stream_orders(self, filters: OrderFilter) -> AsyncIterator[bytes]:
+        """Yield every matching order as one NDJSON line, newest first, without holding a page."""
+        cursor = self.collection.find(filters.mongo_query).sort(KEYSET_SORT)
+        async for doc in cursor:
+            yield orjson.dumps(order_helper(doc), default=json_default) + b"\n"
+
+    async def get_order_by_id(self, order_id: Union[str, ObjectId]) -> Optional[OrderOut]:
         try:
             object_id = convert_objectid(order_id)
             order = await self.collection.find_one({"_id": object_id})
-            return order_helper(order) if order else None
+            return _to_order_out(order) if order else None
         except Exception as e:
             logger.error(f"Error fetching order {order_id}: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
 
-    async def update_order_status(self, order_id: str, status: str) -> bool:
+    async def update_order_status(self, order_id: Union[str, ObjectId], status: str) -> Optional[OrderOut]:
         try:
             object_id = convert_objectid(order_id)
-            valid_statuses = ["pending", "processing", "shipped", "delivered", "cancelled"]
-            if status not in valid_statuses:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-                )
-            result = await self.collection.update_one(
+            status = _parse_status(status)
+            order = await self.collection.find_one_and_update(
                 {"_id": object_id},
-                {"$set": {"status": status, "updated_at": datetime.utcnow()}}
+                {"$set": {"status": status}, "$currentDate": {"updated_at": True}},
+                return_document=ReturnDocument.AFTER,
             )
-            return result.modified_count > 0
+            return _to_order_out(order) if order else None
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error updating order status {order_id}: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
 
-    async def delete_order(self, order_id: str) -> bool:
+    async def bulk_update_status(self, order_ids: List[str], status: str) -> int:
+        """Move every listed order to status in one round trip; returns how many changed."""
+        try:
+            status = _parse_status(status)
+            object_ids = [parse_object_id(order_id) for order_id in order_ids if is_object_id(order_id)]
+            if not object_ids:
+                return 0
+            result = await self.collection.update_many(
+                {"_id": {"$in": object_ids}, "status": {"$ne": status}},
+                {"$set": {"status": status}, "$currentDate": {"updated_at": True}},
+            )
+            return result.modified_count
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error bulk updating order status: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def delete_order(self, order_id: Union[str, ObjectId]) -> bool:
+        """Cancel the order; False if it does not exist or is already cancelled."""
         try:
-            return await self.update_order_status(order_id, "cancelled")
+            result = await self.collection.update_one(
+                {"_id": convert_objectid(order_id), "status": {"$ne": "cancelled"}},
+                {"$set": {"status": "cancelled"}, "$currentDate": {"updated_at": True}},
+            )
+            return result.modified_count > 0
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error deleting order {order_id}: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
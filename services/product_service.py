@@ -1,9 +1,35 @@
-from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from bson import ObjectId
+from fastapi import HTTPException
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from schemas.product import ProductCreate, ProductUpdate, ProductFilter
-from schemas.pagination import PaginationParams, PaginatedResponse
+from pymongo import ReturnDocument
+from schemas.product import (
+    ProductCreate, ProductUpdate, ProductFilter, ProductOut, ProductSizeOut, ProductListAdapter, ProductPage
+)
+from schemas.pagination import (
+    PaginationParams, PaginationMeta, MAX_SKIP, COUNT_MAX_TIME_MS, KEYSET_SORT,
+    decode_cursor, encode_cursor, field_projection, keyset_filter
+)
+from utils.bson_utils import is_object_id, parse_object_id, to_object_id
+
+# ProductOut fields built from stored keys of another name
+_PRODUCT_FIELD_SOURCES = {"id": ("_id",)}
+
+# Best text-index matches first
+_TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+
+# ProductOut is defer_build; model_construct never triggers the build, so do it once here
+ProductOut.model_rebuild()
+
+
+def _to_product_out(doc: Dict[str, Any], _size=ProductSizeOut.model_construct,
+                    _product=ProductOut.model_construct) -> ProductOut:
+    """Build a ProductOut from a stored product without re-validating it (validated on write)."""
+    doc["id"] = str(doc.pop("_id"))
+    doc["sizes"] = [_size(**size) for size in doc.get("sizes", ())]
+    return _product(**doc)
 
 
 class ProductService:
@@ -24,87 +50,105 @@ class ProductService:
         created_product["id"] = str(created_product.pop("_id"))
         return created_product
 
-    async def get_product(self, product_id: str) -> Optional[Dict[str, Any]]:
-        if not ObjectId.is_valid(product_id):
+    async def get_product(self, product_id: Union[str, ObjectId]) -> Optional[ProductOut]:
+        oid = to_object_id(product_id)
+        if oid is None:
             return None
-        product = await self.collection.find_one({"_id": ObjectId(product_id)})
+        product = await self.collection.find_one({"_id": oid})
         if not product:
             return None
-        product["id"] = str(product.pop("_id"))
-        product["created_at"] = product["created_at"].isoformat()
-        product["updated_at"] = product["updated_at"].isoformat() if product["updated_at"] else None
-        return product
+        return _to_product_out(product)
 
-    async def update_product(self, product_id: str, product_update: ProductUpdate) -> Optional[Dict[str, Any]]:
-        if not ObjectId.is_valid(product_id):
+    async def update_product(self, product_id: Union[str, ObjectId], product_update: ProductUpdate) -> Optional[ProductOut]:
+        oid = to_object_id(product_id)
+        if oid is None:
             return None
         update_data = {k: v for k, v in product_update.dict().items() if v is not None}
-        update_data["updated_at"] = datetime.utcnow()
-
-        result = await self.collection.update_one({"_id": ObjectId(product_id)}, {"$set": update_data})
-        if result.matched_count == 0:
+        update: Dict[str, Any] = {"$currentDate": {"updated_at": True}}
+        if update_data:
+            update["$set"] = update_data
+
+        product = await self.collection.find_one_and_update(
+            {"_id": oid},
+            update,
+            return_document=ReturnDocument.AFTER,
+        )
+        if not product:
             return None
-        return await self.get_product(product_id)
+        return _to_product_out(product)
 
-    async def delete_product(self, product_id: str) -> bool:
-        if not ObjectId.is_valid(product_id):
+    async def delete_product(self, product_id: Union[str, ObjectId]) -> bool:
+        oid = to_object_id(product_id)
+        if oid is None:
             return False
-        result = await self.collection.delete_one({"_id": ObjectId(product_id)})
+        result = await self.collection.delete_one({"_id": oid})
         return result.deleted_count > 0
 
-    async def list_products(self, pagination: PaginationParams, filter_params: ProductFilter) -> PaginatedResponse:
-        query_filter = {}
-
-        if filter_params.category:
-            query_filter["category"] = filter_params.category
-        if filter_params.brand:
-            query_filter["brand"] = filter_params.brand
-        if filter_params.min_price is not None:
-            query_filter.setdefault("price", {})["$gte"] = filter_params.min_price
-        if filter_params.max_price is not None:
-            query_filter.setdefault("price", {})["$lte"] = filter_params.max_price
-        if filter_params.size:
-            query_filter["sizes.size"] = filter_params.size
-        if filter_params.in_stock is not None:
-            if filter_params.in_stock:
-                query_filter["sizes"] = {"$elemMatch": {"stock": {"$gt": 0}}}
-            else:
-                query_filter["$or"] = [
-                    {"sizes": {"$size": 0}},
-                    {"sizes": {"$not": {"$elemMatch": {"stock": {"$gt": 0}}}}}
-                ]
-        if filter_params.search:
-            query_filter["$or"] = [
-                {"name": {"$regex": filter_params.search, "$options": "i"}},
-                {"description": {"$regex": filter_params.search, "$options": "i"}},
-                {"tags": {"$in": [filter_params.search]}}
-            ]
-
-        sort_options = [(filter_params.sort_by, -1 if filter_params.sort_order == "desc" else 1)] \
-            if filter_params.sort_by else [("created_at", -1)]
-
-        total_items = await self.collection.count_documents(query_filter)
-        cursor = self.collection.find(query_filter).sort(sort_options).skip(pagination.skip).limit(pagination.limit)
-
-        products = []
-        async for product in cursor:
-            product["id"] = str(product.pop("_id"))
-            product["created_at"] = product["created_at"].isoformat()
-            product["updated_at"] = product["updated_at"].isoformat() if product.get("updated_at") else None
-            products.append(product)
-
-        return PaginatedResponse.create(items=products, params=pagination, total_items=total_items)
+    def _count(self, query_filter: Dict[str, Any]):
+        # An unfiltered total comes from collection metadata instead of an index scan
+        if not query_filter:
+            return self.collection.estimated_document_count()
+        return self.collection.count_documents(query_filter, maxTimeMS=COUNT_MAX_TIME_MS)
+
+    async def list_products(self, pagination: PaginationParams, filter_params: ProductFilter) -> Dict[str, Any]:
+        query_filter = filter_params.mongo_query
+
+        fields = pagination.field_set
+        projection = None
+        if fields:
+            unknown = fields - ProductOut.model_fields.keys()
+            if unknown:
+                raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+            projection = field_projection(fields, _PRODUCT_FIELD_SOURCES)
+
+        if filter_params.sort_by:
+            sort_options = [(filter_params.sort_by, -1 if filter_params.sort_order == "desc" else 1)]
+        elif "$text" in query_filter:
+            sort_options = _TEXT_SCORE_SORT
+        else:
+            sort_options = KEYSET_SORT
+        keyset = sort_options is KEYSET_SORT
+
+        if pagination.after:
+            # Keyset pagination: seek past the cursor on (created_at, _id) instead of skipping
+            position = decode_cursor(pagination.after)
+            if position is None:
+                raise HTTPException(status_code=400, detail="Invalid after cursor")
+            if not keyset:
+                raise HTTPException(status_code=400, detail="after is only supported with the default ordering")
+            cursor = self.collection.find(keyset_filter(query_filter, position), projection).sort(KEYSET_SORT).limit(pagination.limit)
+        else:
+            if pagination.skip > MAX_SKIP:
+                raise HTTPException(status_code=400, detail=f"Offset exceeds {MAX_SKIP}; use after to page further")
+            cursor = self.collection.find(query_filter, projection).sort(sort_options).skip(pagination.skip).limit(pagination.limit)
+
+        total_items, docs = await asyncio.gather(
+            self._count(query_filter),
+            cursor.to_list(length=pagination.limit),
+        )
+        next_cursor = encode_cursor(docs[-1]) if keyset and len(docs) == pagination.limit else None
+
+        products = [_to_product_out(product) for product in docs]
+
+        page = ProductPage.model_construct(
+            items=products, meta=PaginationMeta.create(pagination, total_items, next_cursor)
+        )
+        include = {"items": {"__all__": fields}, "meta": True} if fields else None
+        return ProductListAdapter.dump_python(page, mode="json", include=include, exclude_none=True)
+
+    async def search_products(self, search_term: str, limit: int = 10) -> List[ProductOut]:
+        """Search products through the name/description/tags text index."""
+        cursor = self.collection.find({"$text": {"$search": search_term}}).sort(_TEXT_SCORE_SORT).limit(limit)
+        docs = await cursor.to_list(length=limit)
+        return [_to_product_out(product) for product in docs]
 
     async def check_products_exist(self, product_ids: List[str]) -> Tuple[List[dict], List[str]]:
         """Check if products exist and return (found, missing)"""
-        valid_object_ids = []
-        for pid in product_ids:
-            try:
-                valid_object_ids.append(ObjectId(pid))
-            except Exception:
-                continue
-
-        found_products_cursor = self.collection.find({"_id": {"$in": valid_object_ids}})
+        valid_object_ids = [parse_object_id(pid) for pid in product_ids if is_object_id(pid)]
+
+        found_products_cursor = self.collection.find(
+            {"_id": {"$in": valid_object_ids}}, {"name": 1, "price": 1}
+        )
         found_products = await found_products_cursor.to_list(length=len(valid_object_ids))
 
         found_ids = {str(p["_id"]) for p in found_products}
@@ -0,0 +1,119 @@
+import os
+import sys
+import types
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+# Let the tests import the app packages (utils, services, ...) from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import core.database  # noqa: F401
+except ImportError:
+    # core.config needs a configured environment; the services under test get their
+    # database handle passed in, so only the module's names have to resolve
+    _database = types.ModuleType("core.database")
+    _database.get_collection = _database.get_database = lambda *args, **kwargs: None
+    sys.modules["core.database"] = _database
+
+
+def _matches(doc, query):
+    for key, cond in query.items():
+        value = doc.get(key)
+        if isinstance(cond, dict):
+            if "$ne" in cond and value == cond["$ne"]:
+                return False
+            if "$in" in cond and value not in cond["$in"]:
+                return False
+        elif value != cond:
+            return False
+    return True
+
+
+def _apply(doc, update):
+    doc.update(update.get("$set", {}))
+    for key in update.get("$currentDate", {}):
+        doc[key] = datetime.utcnow()
+
+
+class FakeResult:
+    def __init__(self, inserted_id=None, modified_count=0):
+        self.inserted_id = inserted_id
+        self.modified_count = modified_count
+
+
+class FakeCursor:
+    """The chainable subset of a Motor cursor the services use; sort is a no-op."""
+
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def skip(self, count):
+        self.docs = self.docs[count:]
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length=None):
+        return [dict(doc) for doc in self.docs[:length]]
+
+
+class FakeCollection:
+    """In-memory stand-in for a Motor collection: equality, $ne and $in filters only."""
+
+    def __init__(self):
+        self.docs = []
+
+    def find(self, query=None, projection=None, **kwargs):
+        return FakeCursor([doc for doc in self.docs if _matches(doc, query or {})])
+
+    async def find_one(self, query, *args, **kwargs):
+        return next((dict(doc) for doc in self.docs if _matches(doc, query)), None)
+
+    async def count_documents(self, query, **kwargs):
+        return sum(1 for doc in self.docs if _matches(doc, query))
+
+    async def estimated_document_count(self, **kwargs):
+        return len(self.docs)
+
+    async def insert_one(self, doc):
+        doc.setdefault("_id", ObjectId())
+        self.docs.append(doc)
+        return FakeResult(inserted_id=doc["_id"])
+
+    async def update_one(self, query, update, **kwargs):
+        for doc in self.docs:
+            if _matches(doc, query):
+                _apply(doc, update)
+                return FakeResult(modified_count=1)
+        return FakeResult()
+
+    async def find_one_and_update(self, query, update, **kwargs):
+        for doc in self.docs:
+            if _matches(doc, query):
+                _apply(doc, update)
+                return dict(doc)
+        return None
+
+
+class FakeDatabase(dict):
+    """Collections by name, created on first access as db[name] or db.name."""
+
+    def __getattr__(self, name):
+        return self[name]
+
+    def __missing__(self, name):
+        self[name] = collection = FakeCollection()
+        return collection
+
+
+@pytest.fixture
+def db():
+    return FakeDatabase()
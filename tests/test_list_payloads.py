@@ -0,0 +1,53 @@
+import asyncio
+from datetime import datetime
+
+from bson import ObjectId
+
+from schemas.order import OrderFilter
+from schemas.pagination import PaginationParams
+from schemas.product import ProductFilter
+from services.order_service import OrderService
+from services.product_service import ProductService
+
+
+def _has_null(value):
+    children = value.values() if isinstance(value, dict) else value if isinstance(value, list) else ()
+    return any(child is None or _has_null(child) for child in children)
+
+
+def test_order_list_omits_null_fields(db):
+    asyncio.run(db["orders"].insert_one({
+        "user_id": "u1",
+        "items": [{"product_id": str(ObjectId()), "size": "M", "quantity": 2, "name": "Shirt", "price": 10.0}],
+        "shipping_address": {"full_name": "A", "address_line1": "1 St", "city": "C",
+                             "state": "S", "postal_code": "1", "country": "X"},
+        "status": "pending",
+        "total_amount": 20.0,
+        "created_at": datetime(2024, 1, 1),
+    }))
+
+    payload = asyncio.run(OrderService(db).list_orders(PaginationParams(), OrderFilter()))
+
+    assert not _has_null(payload)
+    order = payload["items"][0]
+    assert order["total"] == 20.0
+    assert "updated_at" not in order and "tracking_number" not in order
+    assert "phone" not in order["shipping_address"]
+    assert "next_cursor" not in payload["meta"]
+
+
+def test_product_list_omits_null_fields(db):
+    asyncio.run(db["products"].insert_one({
+        "name": "Shirt",
+        "description": "Cotton",
+        "price": 10.0,
+        "category": "tops",
+        "created_at": datetime(2024, 1, 1),
+    }))
+
+    payload = asyncio.run(ProductService(db).list_products(PaginationParams(), ProductFilter()))
+
+    assert not _has_null(payload)
+    product = payload["items"][0]
+    assert product["name"] == "Shirt"
+    assert "brand" not in product and "updated_at" not in product
@@ -0,0 +1,40 @@
+from fastapi.testclient import TestClient
+
+import app as mock_app
+
+client = TestClient(mock_app.app)
+
+
+def _store_sizes():
+    return (len(mock_app.PRODUCTS), len(mock_app._by_id), len(mock_app._price_sorted),
+            len(mock_app._names_lc), len(mock_app._descs_lc))
+
+
+def test_create_product_with_null_price_is_indexed():
+    response = client.post("/api/v1/products", json={"name": "Free Sample", "description": "x", "price": None})
+    assert response.status_code == 201
+    assert response.json()["price"] == 0
+
+    listed = client.get("/api/v1/products", params={"max_price": 0}).json()
+    assert [p["name"] for p in listed["items"]] == ["Free Sample"]
+    assert len(set(_store_sizes())) == 1
+
+
+def test_create_product_with_non_numeric_price_is_rejected():
+    before = _store_sizes()
+    response = client.post("/api/v1/products", json={"name": "Bad", "description": "x", "price": "cheap"})
+    assert response.status_code == 400
+    assert _store_sizes() == before
+
+
+def test_search_still_works_after_product_with_null_text_fields():
+    response = client.post("/api/v1/products", json={"name": None, "description": None, "price": 5})
+    assert response.status_code == 201
+
+    plain = client.get("/api/v1/products", params={"search": "t-shirt"})
+    assert plain.status_code == 200
+    assert [p["name"] for p in plain.json()["items"]] == ["Sample T-Shirt"]
+
+    regex = client.get("/api/v1/products", params={"search": "^sample"})
+    assert regex.status_code == 200
+    assert [p["name"] for p in regex.json()["items"]] == ["Sample T-Shirt"]
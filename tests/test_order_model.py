@@ -0,0 +1,11 @@
+import asyncio
+
+import pytest
+
+from models.order import Order
+
+
+def test_create_rejects_malformed_product_id():
+    order_data = {"items": [{"product_id": "not-an-id", "size": "M", "quantity": 1}]}
+    with pytest.raises(ValueError, match="Product not found: not-an-id"):
+        asyncio.run(Order.create(None, order_data))
@@ -0,0 +1,21 @@
+import asyncio
+
+from bson import ObjectId
+
+from services.order_service import OrderService
+
+
+def test_cancelling_twice_only_succeeds_once(db):
+    order_id = asyncio.run(db["orders"].insert_one({"status": "pending"})).inserted_id
+    service = OrderService(db)
+
+    assert asyncio.run(service.delete_order(order_id)) is True
+    stamped = db["orders"].docs[0]["updated_at"]
+
+    assert asyncio.run(service.delete_order(order_id)) is False
+    assert db["orders"].docs[0]["status"] == "cancelled"
+    assert db["orders"].docs[0]["updated_at"] == stamped
+
+
+def test_cancelling_unknown_order_returns_false(db):
+    assert asyncio.run(OrderService(db).delete_order(ObjectId())) is False
@@ -0,0 +1,30 @@
+from bson import ObjectId
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.bson_utils import MongoJSONResponse
+
+app = FastAPI(default_response_class=MongoJSONResponse)
+OID = ObjectId()
+
+
+@app.get("/doc")
+async def read_doc():
+    return {"_id": OID, "tags": [OID], "nested": {"ref": OID}}
+
+
+@app.get("/direct")
+async def read_direct():
+    return MongoJSONResponse({"_id": OID})
+
+
+def test_route_return_value_with_objectid_is_serialized():
+    response = TestClient(app).get("/doc")
+    assert response.status_code == 200
+    assert response.json() == {"_id": str(OID), "tags": [str(OID)], "nested": {"ref": str(OID)}}
+
+
+def test_mongo_json_response_encodes_objectid():
+    response = TestClient(app).get("/direct")
+    assert response.status_code == 200
+    assert response.json() == {"_id": str(OID)}
@@ -0,0 +1,24 @@
+from models.user import User
+
+
+def _user():
+    return User(**{
+        "email": "a@example.com",
+        "password_hash": "  hash-with-padding  ",
+        "first_name": "  Ada ",
+        "last_name": " Lovelace  ",
+        "addresses": [{
+            "full_name": " Ada Lovelace ", "address_line1": " 1 St ", "city": " London ",
+            "state": " LDN ", "postal_code": " N1 ", "country": " UK ",
+        }],
+    })
+
+
+def test_names_and_addresses_are_stripped():
+    user = _user()
+    assert (user.first_name, user.last_name) == ("Ada", "Lovelace")
+    assert user.addresses[0].city == "London"
+
+
+def test_password_hash_is_kept_verbatim():
+    assert _user().password_hash == "  hash-with-padding  "
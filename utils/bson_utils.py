@@ -1,13 +1,45 @@
-from typing import Union, Dict, List, Any
+import re
+from functools import lru_cache
+from typing import Optional, Union, Dict, List, Any
+import orjson
 from bson import ObjectId
+from fastapi.encoders import ENCODERS_BY_TYPE
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
+# 24 hex characters: the only string form ObjectId accepts
+_OID_RE = re.compile(r"^[0-9a-fA-F]{24}$")
+
+
+def is_object_id(value: Any) -> bool:
+    """Check whether value is a valid ObjectId, regex fast path for strings."""
+    if isinstance(value, str):
+        return _OID_RE.match(value) is not None
+    return ObjectId.is_valid(value)
+
+
+@lru_cache(maxsize=4096)
+def parse_object_id(value: str) -> ObjectId:
+    """ObjectId(value), memoized since the same hot ids are parsed request after request.
+
+    The cache is bounded (4096 entries, LRU) and sharing instances is safe because
+    ObjectId has no mutators. Only call it with strings already checked by is_object_id.
+    """
+    return ObjectId(value)
+
+
+def to_object_id(value: Union[str, ObjectId]) -> Optional[ObjectId]:
+    """Return value as an ObjectId, or None if it is not a valid id."""
+    if isinstance(value, ObjectId):
+        return value
+    return parse_object_id(value) if is_object_id(value) else None
+
 
 def str_to_objectid(id_str: Union[str, ObjectId]) -> ObjectId:
     """Convert string to ObjectId."""
     if isinstance(id_str, str):
-        if ObjectId.is_valid(id_str):
-            return ObjectId(id_str)
+        if is_object_id(id_str):
+            return parse_object_id(id_str)
         raise ValueError(f"Invalid ObjectId: {id_str}")
     return id_str
 
@@ -17,47 +49,163 @@ def objectid_to_str(obj_id: ObjectId) -> str:
     return str(obj_id)
 
 
+def json_default(value: Any) -> Any:
+    """orjson default hook: encode ObjectIds as their hex string while dumping."""
+    if type(value) is ObjectId:
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """ORJSONResponse that encodes ObjectIds itself, so documents need no conversion pass first."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=json_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+# Routes without a response_model go through jsonable_encoder before render() is called,
+# so ObjectId has to be known there too or {"_id": ObjectId(...)} fails with a 500.
+ENCODERS_BY_TYPE[ObjectId] = str
+
+
+def _contains_objectid(data: Any) -> bool:
+    """Whether an ObjectId appears anywhere inside data's dicts and lists."""
+    # Exact type() identity checks (no MRO walk) on locally bound types; Mongo documents
+    # decode to plain dicts and lists, so subclasses only matter for data itself.
+    oid_type, dict_type, list_type = ObjectId, dict, list
+    stack = [data]
+    while stack:
+        src = stack.pop()
+        for value in (src if type(src) is list_type else src.values()):
+            kind = type(value)
+            if kind is oid_type:
+                return True
+            if kind is dict_type or kind is list_type:
+                stack.append(value)
+    return False
+
+
 def convert_objectids_to_str(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert all ObjectId values in a dict to strings."""
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, ObjectId):
-            result[key] = str(value)
-        elif isinstance(value, dict):
-            result[key] = convert_objectids_to_str(value)
-        elif isinstance(value, list):
-            result[key] = [
-                convert_objectids_to_str(item) if isinstance(item, dict)
-                else str(item) if isinstance(item, ObjectId)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+    """Convert all ObjectId values in a dict to strings.
+
+    A dict without any ObjectId is returned as-is rather than copied.
+    """
+    if not _contains_objectid(data):
+        return data
+
+    # Walk with an explicit stack of (output container, source container) pairs
+    # instead of recursing, filling each output container as its source is visited.
+    # Output containers are always plain dicts/lists, so their type picks the iteration.
+    oid_type, dict_type, list_type = ObjectId, dict, list
+    result: Dict[str, Any] = {}
+    stack = [(result, data)]
+    while stack:
+        out, src = stack.pop()
+        for key, value in (src.items() if type(out) is dict_type else enumerate(src)):
+            kind = type(value)
+            if kind is oid_type:
+                out[key] = str(value)
+            elif kind is dict_type:
+                out[key] = child = {}
+                stack.append((child, value))
+            elif kind is list_type:
+                if value and type(value[0]) is oid_type and all(type(v) is oid_type for v in value):
+                    # Id arrays: convert with one map(str) instead of walking each element;
+                    # the check stops at the first non-ObjectId, so mixed arrays bail out early
+                    out[key] = list(map(str, value))
+                else:
+                    out[key] = child = [None] * len(value)
+                    stack.append((child, value))
+            else:
+                out[key] = value
     return result
 
 
 def convert_objectids_in_model(model: BaseModel) -> Dict[str, Any]:
-    """Convert all ObjectId values in a Pydantic model to strings."""
-    model_dict = model.dict()
-    return convert_objectids_to_str(model_dict)
+    """Convert all ObjectId values in a Pydantic model to strings.
+
+    Pydantic v2 models dump straight to JSON-safe values in one pydantic-core pass;
+    PyObjectId fields carry their own str serializer for that mode.
+    """
+    if hasattr(model, "model_dump"):
+        return model.model_dump(mode="json")
+    return convert_objectids_to_str(model.dict())
+
+
+def model_to_json(model: BaseModel) -> str:
+    """Serialize a Pydantic model straight to a JSON string with ObjectIds as hex strings.
+
+    For callers that only need JSON, this skips the intermediate dict entirely.
+    """
+    if hasattr(model, "model_dump_json"):
+        return model.model_dump_json()
+    return model.json()
+
+
+# Filter keys whose string values are ObjectIds. user_id and items.product_id are
+# stored as plain strings in this schema, so they must not be coerced.
+_ID_KEYS = frozenset({"_id"})
+
+
+def _is_id_string(value: Any) -> bool:
+    """The one coercion rule: a plain str holding 24 hex characters."""
+    return type(value) is str and _OID_RE.match(value) is not None
+
+
+def _coerce_id(value: Any) -> Any:
+    """value as an ObjectId if it is a 24-hex string, otherwise unchanged."""
+    return parse_object_id(value) if _is_id_string(value) else value
+
+
+def _children(src: Any, in_id: bool):
+    """(key, value, in_id) for each child of a filter dict or list.
+
+    Operator keys ($in, $ne, ...) under an id key stay in id context; lists pass it through.
+    """
+    if isinstance(src, dict):
+        for key, value in src.items():
+            yield key, value, key in _ID_KEYS or (in_id and key.startswith("$"))
+    else:
+        for index, value in enumerate(src):
+            yield index, value, in_id
+
+
+def _has_coercible_id(query_filter: Dict[str, Any]) -> bool:
+    """Whether prepare_for_mongo_query would change anything in query_filter."""
+    stack = [(query_filter, False)]
+    while stack:
+        src, in_id = stack.pop()
+        for _, value, child_in_id in _children(src, in_id):
+            if isinstance(value, (dict, list)):
+                stack.append((value, child_in_id))
+            elif child_in_id and _is_id_string(value):
+                return True
+    return False
 
 
 def prepare_for_mongo_query(query_filter: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert string IDs to ObjectIds in a query filter."""
-    result = {}
-    for key, value in query_filter.items():
-        if key == "_id" and isinstance(value, str) and ObjectId.is_valid(value):
-            result[key] = ObjectId(value)
-        elif isinstance(value, dict):
-            result[key] = prepare_for_mongo_query(value)
-        elif isinstance(value, list):
-            result[key] = [
-                prepare_for_mongo_query(item) if isinstance(item, dict)
-                else ObjectId(item) if key == "_id" and isinstance(item, str) and ObjectId.is_valid(item)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
-    return result 
\ No newline at end of file
+    """Convert string IDs to ObjectIds in a query filter.
+
+    A filter with nothing to convert is returned as-is rather than copied.
+    """
+    if not _has_coercible_id(query_filter):
+        return query_filter
+
+    result: Dict[str, Any] = {}
+    stack = [(result, query_filter, False)]
+    while stack:
+        out, src, in_id = stack.pop()
+        for key, value, child_in_id in _children(src, in_id):
+            if isinstance(value, dict):
+                out[key] = child = {}
+                stack.append((child, value, child_in_id))
+            elif isinstance(value, list):
+                out[key] = child = [None] * len(value)
+                stack.append((child, value, child_in_id))
+            else:
+                out[key] = _coerce_id(value) if child_in_id else value
+    return result
@@ -1,22 +1,32 @@
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
+import orjson
 from fastapi import HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.requests import Request
 from pydantic import ValidationError
 
+from utils.bson_utils import json_default
+
 
 class APIError(Exception):
     """Base API error exception."""
     
+    # Slots keep the four fields out of a per-instance __dict__ (BaseException creates it lazily)
+    __slots__ = ("status_code", "error", "message", "details")
+
+    # Error name used when none is passed; subclasses override it instead of passing error=
+    ERROR_NAME = "APIError"
+
     def __init__(
         self, 
         status_code: int, 
-        error: str, 
-        message: str, 
+        error: Optional[str] = None, 
+        message: str = "", 
         details: Optional[Dict[str, Any]] = None
     ):
         self.status_code = status_code
-        self.error = error
+        self.error = type(self).ERROR_NAME if error is None else error
         self.message = message
         self.details = details
         super().__init__(self.message)
@@ -25,10 +35,12 @@ class APIError(Exception):
 class NotFoundError(APIError):
     """Resource not found error."""
     
+    __slots__ = ()
+    ERROR_NAME = "NotFoundError"
+
     def __init__(self, resource_type: str, resource_id: str):
         super().__init__(
             status_code=status.HTTP_404_NOT_FOUND,
-            error="NotFoundError",
             message=f"{resource_type} with ID {resource_id} not found",
             details={"resource_type": resource_type, "resource_id": resource_id}
         )
@@ -37,10 +49,12 @@ class NotFoundError(APIError):
 class ValidationAPIError(APIError):
     """Validation error."""
     
+    __slots__ = ()
+    ERROR_NAME = "ValidationError"
+
     def __init__(self, message: str, errors: List[Dict[str, Any]]):
         super().__init__(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            error="ValidationError",
             message=message,
             details={"errors": errors}
         )
@@ -49,10 +63,12 @@ class ValidationAPIError(APIError):
 class DatabaseError(APIError):
     """Database operation error."""
     
+    __slots__ = ()
+    ERROR_NAME = "DatabaseError"
+
     def __init__(self, operation: str, message: str):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            error="DatabaseError",
             message=f"Database {operation} failed: {message}",
             details={"operation": operation}
         )
@@ -61,10 +77,12 @@ class DatabaseError(APIError):
 class AuthenticationError(APIError):
     """Authentication error."""
     
+    __slots__ = ()
+    ERROR_NAME = "AuthenticationError"
+
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            error="AuthenticationError",
             message=message
         )
 
@@ -72,71 +90,68 @@ class AuthenticationError(APIError):
 class AuthorizationError(APIError):
     """Authorization error."""
     
+    __slots__ = ()
+    ERROR_NAME = "AuthorizationError"
+
     def __init__(self, message: str = "Not authorized to perform this action"):
         super().__init__(
             status_code=status.HTTP_403_FORBIDDEN,
-            error="AuthorizationError",
             message=message
         )
 
 
 def format_validation_errors(errors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Format validation errors for API response."""
-    formatted_errors = []
-    for error in errors:
-        formatted_errors.append({
-            "loc": error.get("loc", []),
-            "msg": error.get("msg", ""),
-            "type": error.get("type", "")
-        })
-    return formatted_errors
+    # Pydantic error dicts always carry loc, msg and type
+    return [{"loc": e["loc"], "msg": e["msg"], "type": e["type"]} for e in errors]
+
 
+@lru_cache(maxsize=64)
+def _error_prefix(error: str) -> bytes:
+    """Pre-encoded '{"error":...,' opening, shared by every response for that error name."""
+    return b'{"error":' + orjson.dumps(error) + b","
 
-async def api_error_handler(request: Request, exc: APIError) -> JSONResponse:
+
+def _error_response(status_code: int, error: str, fields: Dict[str, Any]) -> Response:
+    """JSON error body: the cached error prefix followed by the per-request fields."""
+    body = _error_prefix(error) + orjson.dumps(fields, default=json_default)[1:]
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+async def api_error_handler(request: Request, exc: APIError) -> Response:
     """Handle API errors."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.error,
-            "message": exc.message,
-            "details": exc.details,
-            "path": request.url.path
-        }
-    )
+    return _error_response(exc.status_code, exc.error, {
+        "message": exc.message,
+        "details": exc.details,
+        "path": request.url.path
+    })
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> Response:
     """Handle HTTP exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": "HTTPException",
-            "message": exc.detail,
-            "path": request.url.path
-        }
-    )
+    return _error_response(exc.status_code, "HTTPException", {
+        "message": exc.detail,
+        "path": request.url.path
+    })
 
 
-async def validation_exception_handler(request: Request, exc: ValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: ValidationError) -> Response:
     """Handle validation exceptions."""
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content={
-            "error": "ValidationError",
-            "message": "Validation error",
-            "details": {"errors": format_validation_errors(exc.errors())},
-            "path": request.url.path
-        }
-    )
+    return _error_response(status.HTTP_422_UNPROCESSABLE_ENTITY, "ValidationError", {
+        "message": "Validation error",
+        "details": {"errors": format_validation_errors(exc.errors())},
+        "path": request.url.path
+    })
+
 
+# Everything in a 500 body except the path is constant, so it is encoded once
+_500_PREFIX = _error_prefix("InternalServerError") + b'"message":"An unexpected error occurred","path":'
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+
+async def general_exception_handler(request: Request, exc: Exception) -> Response:
     """Handle general exceptions."""
-    return JSONResponse(
+    return Response(
+        content=_500_PREFIX + orjson.dumps(request.url.path) + b"}",
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "InternalServerError",
-            "message": "An unexpected error occurred",
-            "path": request.url.path
-        }
-    ) 
\ No newline at end of file
+        media_type="application/json"
+    )
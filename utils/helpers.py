@@ -1,22 +1,34 @@
+import logging
 from bson import ObjectId
 from fastapi import HTTPException
-from typing import List, Dict
+from typing import Any, List, Dict, Union
+
+from utils.bson_utils import to_object_id
+
+_api_logger = logging.getLogger("api")
 
 
 def convert_objectid(object_id: str) -> ObjectId:
-    try:
-        return ObjectId(object_id)
-    except Exception:
+    # 24-hex strings only; anything else (including None, which ObjectId() would
+    # silently turn into a fresh id) is rejected without a parse attempt
+    oid = to_object_id(object_id)
+    if oid is None:
         raise HTTPException(status_code=400, detail="Invalid ObjectId")
+    return oid
 
 
 def calculate_total_amount(
-    items: List[Dict], products: List[Dict]
+    items: List[Dict], products: Union[List[Dict], Dict[str, Dict]]
 ) -> float:
-    """Calculate total bill based on quantity and matched product sizes and prices"""
+    """Calculate total bill based on quantity and matched product sizes and prices.
+
+    products may be a list of product documents or a mapping already keyed by product id.
+    """
 
-    product_map = {str(p["_id"]): p for p in products}
-    total = 0.0
+    product_map = products if isinstance(products, dict) else {str(p["_id"]): p for p in products}
+    # Sizes keyed by name, built only for the products the items actually reference
+    size_maps: Dict[str, Dict[str, Dict]] = {}
+    total_cents = 0
 
     for item in items:
         product_id = item["product_id"]
@@ -27,18 +39,20 @@ def calculate_total_amount(
         if not product:
             raise HTTPException(status_code=400, detail=f"Invalid product ID: {product_id}")
 
-        # Look for the matching size
-        size_info = next((s for s in product.get("sizes", []) if s["size"] == size), None)
-        if not size_info:
+        sizes = size_maps.get(product_id)
+        if sizes is None:
+            sizes = size_maps[product_id] = {s["size"]: s for s in product.get("sizes", [])}
+
+        if size not in sizes:
             raise HTTPException(
                 status_code=400,
                 detail=f"Size '{size}' not available for product '{product['name']}'."
             )
 
-        price = product["price"]
-        total += price * quantity
+        # Summed in integer cents, as create_order does, so there is no float drift to round away
+        total_cents += round(product["price"] * 100) * quantity
 
-    return round(total, 2)
+    return total_cents / 100
 
 
 class ValidationHelper:
@@ -53,3 +67,12 @@ class ValidationHelper:
             if "product_id" not in item or "quantity" not in item or "size" not in item:
                 raise HTTPException(status_code=400, detail="Each item must have product_id, quantity, and size")
         return data
+
+
+def log_api_call(path: str, method: str, **fields: Any) -> None:
+    """Log an API call as structured fields; nothing is built unless INFO is enabled."""
+    if _api_logger.isEnabledFor(logging.INFO):
+        _api_logger.info(
+            "%s %s", method, path,
+            extra={"extra": {"path": path, "method": method, **fields}},
+        )
@@ -1,40 +1,44 @@
-from typing import Dict, List, Any, Tuple, TypeVar, Generic, Optional
-from math import ceil
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Tuple, TypeVar, Generic, Optional
 
 
 T = TypeVar('T')
 
+_META_KEYS = ("page", "page_size", "total_items", "total_pages", "has_previous", "has_next")
+
+
+def ceildiv(a: int, b: int) -> int:
+    """Integer ceiling of a / b, without a float divide or math.ceil."""
+    return -(-a // b)
+
+
+def _clamp(page: int, page_size: int) -> Tuple[int, int]:
+    """Page at least 1, page_size between 1 and 100."""
+    return max(1, page), min(max(1, page_size), 100)
+
+
+@lru_cache(maxsize=512)
+def _meta(page: int, page_size: int, total_items: int) -> Tuple[int, int, int, int, bool, bool]:
+    """Pagination metadata values in _META_KEYS order; list endpoints repeat the same few combinations."""
+    total_pages = ceildiv(total_items, page_size) if total_items > 0 else 0
+    return page, page_size, total_items, total_pages, page > 1, page < total_pages
+
 
 class Paginator:
     """Helper class for pagination."""
     
+    # Fixed fields, no per-instance __dict__; skip/limit are computed once up front
+    __slots__ = ("page", "page_size", "skip", "limit")
+
     def __init__(self, page: int = 1, page_size: int = 10):
         """Initialize paginator with page and page_size."""
-        self.page = max(1, page)  # Ensure page is at least 1
-        self.page_size = min(max(1, page_size), 100)  # Ensure page_size is between 1 and 100
-    
-    @property
-    def skip(self) -> int:
-        """Calculate skip value for database query."""
-        return (self.page - 1) * self.page_size
-    
-    @property
-    def limit(self) -> int:
-        """Return limit value for database query."""
-        return self.page_size
+        self.page, self.page_size = _clamp(page, page_size)
+        self.skip = (self.page - 1) * self.page_size  # Offset for the database query
+        self.limit = self.page_size  # Limit for the database query
     
     def get_pagination_metadata(self, total_items: int) -> Dict[str, Any]:
         """Generate pagination metadata."""
-        total_pages = ceil(total_items / self.page_size) if total_items > 0 else 0
-        
-        return {
-            "page": self.page,
-            "page_size": self.page_size,
-            "total_items": total_items,
-            "total_pages": total_pages,
-            "has_previous": self.page > 1,
-            "has_next": self.page < total_pages
-        }
+        return dict(zip(_META_KEYS, _meta(self.page, self.page_size, total_items)))
     
     def paginate_data(self, data: List[T], total_items: int) -> Tuple[List[T], Dict[str, Any]]:
         """Paginate data and return with metadata."""
@@ -42,15 +46,16 @@ class Paginator:
         return data, metadata
 
 
-def get_pagination_params(page: int = 1, page_size: int = 10) -> Dict[str, int]:
+class PageParams(NamedTuple):
+    """skip/limit pair for a database query; use _asdict() where a dict is needed."""
+    skip: int
+    limit: int
+
+
+def get_pagination_params(page: int = 1, page_size: int = 10) -> PageParams:
     """Get pagination parameters for database query."""
-    page = max(1, page)  # Ensure page is at least 1
-    page_size = min(max(1, page_size), 100)  # Ensure page_size is between 1 and 100
-    
-    return {
-        "skip": (page - 1) * page_size,
-        "limit": page_size
-    }
+    page, page_size = _clamp(page, page_size)
+    return PageParams((page - 1) * page_size, page_size)
 
 
 def create_paginated_response(
@@ -60,18 +65,9 @@ def create_paginated_response(
     total_items: int
 ) -> Dict[str, Any]:
     """Create a standardized paginated response."""
-    total_pages = ceil(total_items / page_size) if total_items > 0 else 0
-    
     return {
         "items": items,
-        "meta": {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total_items,
-            "total_pages": total_pages,
-            "has_previous": page > 1,
-            "has_next": page < total_pages
-        }
+        "meta": dict(zip(_META_KEYS, _meta(page, page_size, total_items)))
     }
 
 